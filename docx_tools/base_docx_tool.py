@@ -1,33 +1,40 @@
 import io
 import logging
-import re
 from docx import Document
 
 from upload_tools import upload_file
 from .helpers import (
     load_templates,
+    open_template,
     parse_inline_formatting,
     parse_table,
     add_table_to_doc,
     process_list_items,
+    ORDERED_LIST_PATTERN,
+    UNORDERED_LIST_PATTERN,
 )
 
 logger = logging.getLogger(__name__)
 
 
-def markdown_to_word(markdown_content):
-    """Convert Markdown to Word document."""
-    logger.info("Starting markdown_to_word conversion")
+def open_base_document():
+    """Open the Word template used for markdown conversion, or a blank document if none is found."""
     path = load_templates()
 
     # Create document with or without template
     if path:
         logger.debug(f"Using Word template at: {path}")
-        doc = Document(path)
-    else:
-        doc = Document()  # Create blank document if no template
-        logger.warning("No template found, creating blank document")
+        return open_template(path)
+    logger.warning("No template found, creating blank document")
+    return Document()  # Create blank document if no template
+
+
+def _add_markdown(doc, markdown_content) -> str:
+    """Append Markdown content to doc and return a summary of the added elements.
 
+    Raises:
+        Exception: Any parsing error, after logging it.
+    """
     # Split content into lines, but preserve line breaks within paragraphs
     lines = markdown_content.split('\n')
     i = 0
@@ -118,11 +125,11 @@ def markdown_to_word(markdown_content):
                     tables_count += 1
                     logger.debug(f"Added table with {len(table_data)} rows")
 
-            elif re.match(r'^\d+\.\s+', line):
+            elif ORDERED_LIST_PATTERN.match(line):
                 i = process_list_items(lines, i, doc, True, 0)
                 ordered_lists += 1
 
-            elif re.match(r'^[-*+]\s+', line):
+            elif UNORDERED_LIST_PATTERN.match(line):
                 i = process_list_items(lines, i, doc, False, 0)
                 unordered_lists += 1
 
@@ -147,6 +154,41 @@ def markdown_to_word(markdown_content):
 
     except Exception as e:
         logger.error(f"Error in parsing markdown: {e}", exc_info=True)
+        raise
+
+    return (
+        f"headers={headers_count}, tables={tables_count}, ordered_lists={ordered_lists}, "
+        f"unordered_lists={unordered_lists}, quotes={quotes_count}, paragraphs={paragraphs_count}"
+    )
+
+
+def markdown_to_document(markdown_content):
+    """Convert Markdown to an in-memory Word Document.
+
+    This is the conversion step of markdown_to_word without the upload, so it
+    can be reused wherever the Document itself is needed.
+
+    Raises:
+        Exception: Any template loading or parsing error.
+    """
+    doc = open_base_document()
+    summary = _add_markdown(doc, markdown_content)
+    logger.info(f"Parsed markdown ({summary})")
+    return doc
+
+
+def markdown_to_word(markdown_content):
+    """Convert Markdown to Word document."""
+    logger.info("Starting markdown_to_word conversion")
+    try:
+        doc = open_base_document()
+    except Exception as e:
+        logger.error(f"Error loading Word template: {e}", exc_info=True)
+        return f"Error loading Word template: {e}"
+
+    try:
+        summary = _add_markdown(doc, markdown_content)
+    except Exception as e:
         return f"Error in parsing markdown: {e}"
 
     # Save the document to BytesIO and upload
@@ -159,10 +201,7 @@ def markdown_to_word(markdown_content):
         result = upload_file(file_object, "docx")
         file_object.close()
 
-        logger.info(
-            f"Word upload completed (headers={headers_count}, tables={tables_count}, ordered_lists={ordered_lists}, "
-            f"unordered_lists={unordered_lists}, quotes={quotes_count}, paragraphs={paragraphs_count})"
-        )
+        logger.info(f"Word upload completed ({summary})")
         return result
     except Exception as e:
         logger.error(f"Error saving/uploading Word document: {e}", exc_info=True)
@@ -35,18 +35,21 @@ from pathlib import Path
 from typing import Any, Dict, Optional, Literal
 
 import yaml
+from lxml import etree
 from docx import Document as DocxDocument
+from docx.oxml.ns import nsmap
 from docx.text.paragraph import Paragraph
 from docx.table import Table
 from pydantic import Field, create_model
 from fastmcp import FastMCP
 
 from upload_tools import upload_file
-from template_utils import find_file_in_template_dirs
+from template_utils import find_file_in_template_dirs, YAML_LOADER
 from .helpers import (
     parse_inline_formatting,
     contains_block_markdown,
     process_markdown_block,
+    open_template,
 )
 
 __all__ = ["register_docx_template_tools_from_yaml"]
@@ -65,6 +68,17 @@ TYPE_MAP = {
 # Regex to find Mustache-style placeholders: {{name}} or {{{name}}}
 PLACEHOLDER_PATTERN = re.compile(r'\{\{\{?([a-zA-Z_][a-zA-Z0-9_]*)\}?\}\}')
 
+# Direct-child paragraphs whose text contains "{{", even when split across runs;
+# lets lxml skip placeholder-free paragraphs without building Paragraph objects
+PLACEHOLDER_PARAGRAPHS_XPATH = etree.XPath(
+    "./w:p[contains(string(.), '{{')]", namespaces={"w": nsmap["w"]}
+)
+
+# Same test over every paragraph in a table, at any cell or nesting depth
+TABLE_PLACEHOLDER_PARAGRAPHS_XPATH = etree.XPath(
+    ".//w:p[contains(string(.), '{{')]", namespaces={"w": nsmap["w"]}
+)
+
 
 
 def _insert_markdown_content_after_paragraph(
@@ -161,14 +175,15 @@ def _replace_placeholder_in_paragraph(
         return False
 
     # Build a map of character positions to runs
-    combined_text = ""
+    run_texts = [run.text for run in runs]
+    combined_text = "".join(run_texts)
     run_info = []  # List of (start_pos, end_pos, run)
 
-    for run in runs:
-        start = len(combined_text)
-        combined_text += run.text
-        end = len(combined_text)
+    start = 0
+    for run, text in zip(runs, run_texts):
+        end = start + len(text)
         run_info.append((start, end, run))
+        start = end
 
     # Find the placeholder in the combined text
     placeholder_start = combined_text.find(placeholder)
@@ -266,28 +281,28 @@ def _replace_placeholders_in_paragraph(
     while iteration < max_iterations:
         iteration += 1
 
-        # Get current paragraph text and find placeholders
+        # Get current paragraph text and find placeholders; most paragraphs
+        # have none, so skip the regex unless an opening brace pair is present
         full_text = paragraph.text
-        matches = PLACEHOLDER_PATTERN.findall(full_text)
-
-        if not matches:
+        if "{{" not in full_text:
             break
 
         # Find the first placeholder that exists in context
         replaced = False
-        for placeholder_name in matches:
+        for match in PLACEHOLDER_PATTERN.finditer(full_text):
+            placeholder_name = match.group(1)
             if placeholder_name not in context:
                 continue
 
+            # Template tools pass values already converted to str; only
+            # convert what a direct caller left as None or another type
             value = context[placeholder_name]
-            if value is None:
-                value = ""
-            else:
-                value = str(value)
+            if type(value) is not str:
+                value = "" if value is None else str(value)
 
             # Try triple brace first, then double brace
             for placeholder in [f'{{{{{{{placeholder_name}}}}}}}', f'{{{{{placeholder_name}}}}}']:
-                if placeholder in paragraph.text:
+                if placeholder in full_text:
                     if _replace_placeholder_in_paragraph(paragraph, placeholder, value, doc):
                         replaced = True
                         break
@@ -314,11 +329,15 @@ def _replace_placeholders_in_table(
         context: Dictionary mapping placeholder names to their values
         doc: The Word document (not used for tables, as block content not supported)
     """
-    for row in table.rows:
-        for cell in row.cells:
-            for paragraph in cell.paragraphs:
-                # Note: We don't pass doc to avoid inserting lists in table cells
-                _replace_placeholders_in_paragraph(paragraph, context, doc=None)
+    # One lxml walk over the table instead of building row and cell wrappers
+    for p in TABLE_PLACEHOLDER_PARAGRAPHS_XPATH(table._tbl):
+        # Note: We don't pass doc to avoid inserting lists in table cells
+        _replace_placeholders_in_paragraph(Paragraph(p, table), context, doc=None)
+
+
+def _placeholder_paragraphs(container) -> list[Paragraph]:
+    """Return the paragraphs of a body, header or footer that may hold placeholders."""
+    return [Paragraph(p, container) for p in PLACEHOLDER_PARAGRAPHS_XPATH(container._element)]
 
 
 def _replace_placeholders_in_document(doc: DocxDocument, context: Dict[str, str]) -> None:
@@ -334,7 +353,7 @@ def _replace_placeholders_in_document(doc: DocxDocument, context: Dict[str, str]
         context: Dictionary mapping placeholder names to their values
     """
     # Process main body paragraphs
-    for paragraph in doc.paragraphs:
+    for paragraph in _placeholder_paragraphs(doc._body):
         _replace_placeholders_in_paragraph(paragraph, context, doc)
 
     # Process tables
@@ -345,7 +364,7 @@ def _replace_placeholders_in_document(doc: DocxDocument, context: Dict[str, str]
     for section in doc.sections:
         # Header
         if section.header:
-            for paragraph in section.header.paragraphs:
+            for paragraph in _placeholder_paragraphs(section.header):
                 # Headers/footers: don't support block content
                 _replace_placeholders_in_paragraph(paragraph, context, doc=None)
             for table in section.header.tables:
@@ -353,13 +372,35 @@ def _replace_placeholders_in_document(doc: DocxDocument, context: Dict[str, str]
 
         # Footer
         if section.footer:
-            for paragraph in section.footer.paragraphs:
+            for paragraph in _placeholder_paragraphs(section.footer):
                 # Headers/footers: don't support block content
                 _replace_placeholders_in_paragraph(paragraph, context, doc=None)
             for table in section.footer.tables:
                 _replace_placeholders_in_table(table, context, doc=None)
 
 
+def render_docx_template(template_path: str, context: Dict[str, str]) -> io.BytesIO:
+    """Render a DOCX template into an in-memory .docx file.
+
+    The template is parsed from cached bytes, placeholders are replaced on the
+    in-memory tree and the result is serialized exactly once.
+
+    Args:
+        template_path: Path to the .docx template
+        context: Dictionary mapping placeholder names to their values
+
+    Returns:
+        Buffer holding the rendered document, positioned at the start
+    """
+    doc = open_template(template_path)
+    _replace_placeholders_in_document(doc, context)
+
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    buffer.seek(0)
+    return buffer
+
+
 def register_docx_template_tools_from_yaml(mcp: FastMCP, yaml_path: Path) -> None:
     """Register dynamic DOCX template tools from a YAML configuration file.
 
@@ -368,7 +409,7 @@ def register_docx_template_tools_from_yaml(mcp: FastMCP, yaml_path: Path) -> Non
         yaml_path: Path to the YAML configuration file
     """
     try:
-        cfg = yaml.safe_load(yaml_path.read_text(encoding="utf-8")) or {}
+        cfg = yaml.load(yaml_path.read_text(encoding="utf-8"), Loader=YAML_LOADER) or {}
     except Exception as e:
         logger.error(f"[dynamic-docx] Failed to load YAML '{yaml_path}': {e}")
         return
@@ -468,21 +509,12 @@ def _register_single_template(mcp: FastMCP, spec: Dict[str, Any]) -> None:
     def make_tool_fn(_model=model, _template_path=resolved, _name=name):
         def tool_impl(data: _model) -> str:  # type: ignore
             try:
-                # Load the template document
-                doc = DocxDocument(_template_path)
-
                 # Build context from input data
                 payload = data.model_dump()
                 context = {k: ("" if v is None else str(v)) for k, v in payload.items()}
 
-                # Replace placeholders
-                _replace_placeholders_in_document(doc, context)
-
-                # Save to buffer and upload
-                buffer = io.BytesIO()
-                doc.save(buffer)
-                buffer.seek(0)
-
+                # Render in memory and upload
+                buffer = render_docx_template(_template_path, context)
                 result = upload_file(buffer, "docx")
                 buffer.close()
 
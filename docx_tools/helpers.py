@@ -1,6 +1,10 @@
+import io
 import logging
+import os
 import re
+from functools import lru_cache
 
+from docx import Document
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 from docx.opc.constants import RELATIONSHIP_TYPE
@@ -8,6 +12,17 @@ from template_utils import find_docx_template
 
 logger = logging.getLogger(__name__)
 
+# Inline formatting markers (see _tokenize_segment for the breakdown)
+INLINE_FORMAT_PATTERN = re.compile(
+    r'(\*\*(?:[^*]|\*(?!\*))+\*\*|\*(?:[^*]|\*\*[^*]*\*\*)+\*|`[^`]+`|\[[^\]]*\]\([^)]*\))'
+)
+LINK_PATTERN = re.compile(r'\[(.*?)]\((.*?)\)')
+ESCAPE_PATTERN = re.compile(r'\\(.)')
+
+# List items with their text captured
+ORDERED_LIST_ITEM_PATTERN = re.compile(r'^\d+\.\s+(.+)')
+UNORDERED_LIST_ITEM_PATTERN = re.compile(r'^[-*+]\s+(.+)')
+
 
 def load_templates():
     """Resolve Word template path from custom/default template directories.
@@ -22,6 +37,26 @@ def load_templates():
     return path
 
 
+@lru_cache(maxsize=32)
+def _read_template_bytes(path: str, mtime_ns: int) -> bytes:
+    """Read a template file; keyed on mtime so an edited template is re-read."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def open_template(path: str):
+    """Open a Word template as a fresh Document, reading the file only when it changed.
+
+    Args:
+        path: Path to the .docx template
+
+    Returns:
+        A new Document parsed from the cached template bytes
+    """
+    data = _read_template_bytes(path, os.stat(path).st_mtime_ns)
+    return Document(io.BytesIO(data))
+
+
 def add_hyperlink(paragraph, text, url, color="0000FF", underline=True):
     """Adds a hyperlink to a paragraph"""
     part = paragraph.part
@@ -57,6 +92,10 @@ def add_hyperlink(paragraph, text, url, color="0000FF", underline=True):
     paragraph._p.append(hyperlink)
 
 
+# Inline token kinds produced by _tokenize_inline
+_TEXT, _CODE, _LINK, _BREAK = "text", "code", "link", "break"
+
+
 def parse_inline_formatting(text, paragraph, bold=False, italic=False):
     """Parse inline markdown formatting like **bold**, *italic*, and [links](url)
 
@@ -66,6 +105,26 @@ def parse_inline_formatting(text, paragraph, bold=False, italic=False):
         bold: Whether the current context is bold (for nested formatting)
         italic: Whether the current context is italic (for nested formatting)
     """
+    _emit_tokens(_tokenize_inline(text, bold, italic), paragraph)
+
+
+@lru_cache(maxsize=256)
+def _tokenize_inline(text, bold=False, italic=False):
+    """Split inline markdown into a tuple of (kind, text, url, bold, italic) tokens.
+
+    Parsing is separated from adding runs so repeated values (e.g. the same
+    placeholder value or table cell text) are only parsed once.
+
+    Args:
+        text: The text to parse
+        bold: Whether the current context is bold
+        italic: Whether the current context is italic
+
+    Returns:
+        Tuple of tokens to be replayed by _emit_tokens
+    """
+    tokens = []
+
     # First handle escape characters
     text = handle_escapes(text)
 
@@ -77,32 +136,37 @@ def parse_inline_formatting(text, paragraph, bold=False, italic=False):
         if not line_part and line_idx == len(line_parts) - 1:
             continue
 
-        _parse_formatting_segment(line_part, paragraph, bold, italic)
+        _tokenize_segment(line_part, bold, italic, tokens)
 
         # Add line break if this isn't the last part
         if line_idx < len(line_parts) - 1:
-            paragraph.add_run().add_break()
+            tokens.append((_BREAK, "", None, False, False))
 
+    return tuple(tokens)
 
-def _parse_formatting_segment(text, paragraph, bold=False, italic=False):
-    """Parse a single text segment for inline markdown formatting.
 
-    This is the core parsing function used by both parse_inline_formatting
-    (for line-break-aware parsing) and recursive nested formatting.
+def _tokenize_segment(text, bold, italic, tokens):
+    """Tokenize a single text segment for inline markdown formatting.
 
     Args:
         text: The text segment to parse (no line breaks expected)
-        paragraph: The paragraph to add runs to
         bold: Whether the current context is bold
         italic: Whether the current context is italic
+        tokens: List the tokens are appended to
     """
+    # Plain text has none of the marker characters; skip the regex entirely
+    if '*' not in text and '`' not in text and '[' not in text:
+        if text:
+            tokens.append((_TEXT, text, None, bold, italic))
+        return
+
     # Split text by formatting markers while preserving the markers
     # Regex explanation:
     # - \*\*(?:[^*]|\*(?!\*))+\*\* : bold (**...**) - matches ** followed by any chars except **, ending with **
     # - \*(?:[^*]|\*\*[^*]*\*\*)+\* : italic (*...*) - matches * followed by any chars or nested **, ending with *
     # - `[^`]+` : inline code
     # - \[[^\]]*\]\([^)]*\) : links [text](url)
-    parts = re.split(r'(\*\*(?:[^*]|\*(?!\*))+\*\*|\*(?:[^*]|\*\*[^*]*\*\*)+\*|`[^`]+`|\[[^\]]*\]\([^)]*\))', text)
+    parts = INLINE_FORMAT_PATTERN.split(text)
 
     for part in parts:
         if not part:
@@ -110,34 +174,55 @@ def _parse_formatting_segment(text, paragraph, bold=False, italic=False):
 
         # Bold text (**text**)
         if part.startswith('**') and part.endswith('**'):
-            inner_text = part[2:-2]
-            _parse_formatting_segment(inner_text, paragraph, bold=True, italic=italic)
+            _tokenize_segment(part[2:-2], True, italic, tokens)
         # Italic text (*text*)
         elif part.startswith('*') and part.endswith('*') and not part.startswith('**'):
-            inner_text = part[1:-1]
-            _parse_formatting_segment(inner_text, paragraph, bold=bold, italic=True)
+            _tokenize_segment(part[1:-1], bold, True, tokens)
         # Inline code (`code`)
         elif part.startswith('`') and part.endswith('`'):
-            code_text = part[1:-1]
-            run = paragraph.add_run(code_text)
-            run.font.name = 'Courier New'
-            if bold:
-                run.bold = True
-            if italic:
-                run.italic = True
+            tokens.append((_CODE, part[1:-1], None, bold, italic))
         # Links [text](url)
         elif part.startswith('[') and '](' in part and part.endswith(')'):
-            link_match = re.match(r'\[(.*?)]\((.*?)\)', part)
+            link_match = LINK_PATTERN.match(part)
             if link_match:
                 link_text, url = link_match.groups()
-                add_hyperlink(paragraph, link_text, url)
+                tokens.append((_LINK, link_text, url, False, False))
         else:
             # Plain text with inherited formatting
-            run = paragraph.add_run(part)
-            if bold:
-                run.bold = True
-            if italic:
-                run.italic = True
+            tokens.append((_TEXT, part, None, bold, italic))
+
+
+def _emit_tokens(tokens, paragraph):
+    """Add runs, breaks and hyperlinks for inline tokens to a paragraph."""
+    for kind, text, url, bold, italic in tokens:
+        if kind == _BREAK:
+            paragraph.add_run().add_break()
+            continue
+        if kind == _LINK:
+            add_hyperlink(paragraph, text, url)
+            continue
+
+        run = paragraph.add_run(text)
+        if kind == _CODE:
+            run.font.name = 'Courier New'
+        if bold:
+            run.bold = True
+        if italic:
+            run.italic = True
+
+
+def _parse_formatting_segment(text, paragraph, bold=False, italic=False):
+    """Parse a single text segment for inline markdown formatting.
+
+    Args:
+        text: The text segment to parse (no line breaks expected)
+        paragraph: The paragraph to add runs to
+        bold: Whether the current context is bold
+        italic: Whether the current context is italic
+    """
+    tokens = []
+    _tokenize_segment(text, bold, italic, tokens)
+    _emit_tokens(tokens, paragraph)
 
 
 def _parse_with_formatting(text, paragraph, bold=False, italic=False):
@@ -150,26 +235,11 @@ def _parse_with_formatting(text, paragraph, bold=False, italic=False):
 
 def handle_escapes(text):
     """Handle backslash escaped characters"""
-    # Replace escaped characters with placeholders first to avoid conflicts
-    escape_map = {}
-    placeholder_counter = 0
-
-    def replace_escape(match):
-        nonlocal placeholder_counter
-        escaped_char = match.group(1)
-        placeholder = f"__ESC_{placeholder_counter}__"
-        escape_map[placeholder] = escaped_char
-        placeholder_counter += 1
-        return placeholder
-
-    # Find and replace all escaped characters
-    text = re.sub(r'\\(.)', replace_escape, text)
-
-    # After all other processing, restore the escaped characters
-    for placeholder, char in escape_map.items():
-        text = text.replace(placeholder, char)
-
-    return text
+    # Nothing to unescape in most values; skip the regex entirely
+    if '\\' not in text:
+        return text
+    # Drop the backslash and keep the escaped character, in one pass
+    return ESCAPE_PATTERN.sub(r'\1', text)
 
 
 def parse_table(lines, start_idx):
@@ -225,6 +295,15 @@ def add_table_to_doc(table_data, doc):
                 parse_inline_formatting(cell_text, cell_paragraph)
 
 
+def _split_list_indent(line):
+    """Return (nesting level, stripped text) for a markdown line.
+
+    Uses 3 spaces per level to match typical markdown indentation.
+    """
+    content = line.lstrip()
+    return (len(line) - len(content)) // 3, content.rstrip()
+
+
 def process_list_items(lines, start_idx, doc, is_ordered=False, level=0):
     """Process markdown list items with proper Word numbering.
 
@@ -277,12 +356,7 @@ def process_list_items_returning_elements(
     i = start_idx
 
     while i < len(lines):
-        line = lines[i].strip()
-
-        # Determine indentation level from original line
-        original_line = lines[i]
-        indent = len(original_line) - len(original_line.lstrip())
-        current_level = indent // 3  # Use 3 spaces per level to match typical markdown indentation
+        current_level, line = _split_list_indent(lines[i])
 
         # If indentation doesn't match our expected level, this item doesn't belong to this list
         if current_level != level:
@@ -290,9 +364,9 @@ def process_list_items_returning_elements(
 
         # Check if this is a list item at our current level
         if is_ordered:
-            list_match = re.match(r'^\d+\.\s+(.+)', line)
+            list_match = ORDERED_LIST_ITEM_PATTERN.match(line)
         else:
-            list_match = re.match(r'^[-*+]\s+(.+)', line)
+            list_match = UNORDERED_LIST_ITEM_PATTERN.match(line)
 
         if not list_match:
             break
@@ -314,24 +388,20 @@ def process_list_items_returning_elements(
             if i >= len(lines):
                 break
 
-            next_line = lines[i].strip()
+            next_level, next_line = _split_list_indent(lines[i])
             if not next_line:
                 i += 1
                 continue
 
-            next_original = lines[i]
-            next_indent = len(next_original) - len(next_original.lstrip())
-            next_level = next_indent // 3  # Use 3 spaces per level
-
             if next_level > level:
                 # This is a nested item - process the nested list
-                if re.match(r'^\d+\.\s+', next_line):
+                if ORDERED_LIST_PATTERN.match(next_line):
                     i, nested_elements = process_list_items_returning_elements(
                         lines, i, doc, True, next_level, return_elements
                     )
                     if return_elements and nested_elements:
                         elements.extend(nested_elements)
-                elif re.match(r'^[-*+]\s+', next_line):
+                elif UNORDERED_LIST_PATTERN.match(next_line):
                     i, nested_elements = process_list_items_returning_elements(
                         lines, i, doc, False, next_level, return_elements
                     )
@@ -355,6 +425,10 @@ ORDERED_LIST_PATTERN = re.compile(r'^\d+\.\s+')
 UNORDERED_LIST_PATTERN = re.compile(r'^[-*+]\s+')
 HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+)$')
 
+# Any line that, once stripped, starts a list item or heading; one search over
+# the whole value instead of splitting it into lines
+BLOCK_MARKDOWN_PATTERN = re.compile(r'^[^\S\n]*(?:\d+\.|[-*+]|#{1,6})[^\S\n]+\S', re.MULTILINE)
+
 
 def contains_block_markdown(value: str) -> bool:
     """Check if the value contains block-level markdown content.
@@ -370,16 +444,7 @@ def contains_block_markdown(value: str) -> bool:
     Returns:
         True if value contains block-level content
     """
-    lines = value.split('\n')
-    for line in lines:
-        stripped = line.strip()
-        if ORDERED_LIST_PATTERN.match(stripped):
-            return True
-        if UNORDERED_LIST_PATTERN.match(stripped):
-            return True
-        if HEADING_PATTERN.match(stripped):
-            return True
-    return False
+    return BLOCK_MARKDOWN_PATTERN.search(value) is not None
 
 
 def process_markdown_block(doc, lines, start_idx, return_element=True):
@@ -21,7 +21,7 @@ from fastmcp import FastMCP
 import logging
 
 from upload_tools import upload_file
-from template_utils import find_email_template
+from template_utils import find_email_template, YAML_LOADER
 
 __all__ = ["register_email_template_tools_from_yaml"]
 
@@ -46,7 +46,7 @@ BASE_FIELDS: Dict[str, Any] = {
 
 def register_email_template_tools_from_yaml(mcp: FastMCP, yaml_path: Path) -> None:
     try:
-        cfg = yaml.safe_load(yaml_path.read_text(encoding="utf-8")) or {}
+        cfg = yaml.load(yaml_path.read_text(encoding="utf-8"), Loader=YAML_LOADER) or {}
     except Exception as e:  # pragma: no cover
         logger.error(f"[dynamic-email] Failed to load YAML '{yaml_path}': {e}")
         return
@@ -4,6 +4,8 @@ from pathlib import Path
 from typing import Optional, Tuple
 import logging
 
+import yaml
+
 logger = logging.getLogger(__name__)
 
 # Base directory of the project (this file lives at project root)
@@ -17,9 +19,12 @@ APP_DEFAULT_DIR = Path("/app/default_templates")
 LOCAL_CUSTOM_DIR = BASE_DIR / "custom_templates"
 LOCAL_DEFAULT_DIR = BASE_DIR / "default_templates"
 
+# PyYAML's libyaml-backed safe loader for template configs, falling back to the pure-Python one
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
-def _candidate_dirs() -> list[Path]:
-    """Return template search directories in priority order.
+def _existing_template_dirs() -> tuple[Path, ...]:
+    """Return the template directories that exist on this host, in priority order.
 
     Order:
     1) /app/custom_templates (production)
@@ -27,12 +32,19 @@ def _candidate_dirs() -> list[Path]:
     3) /app/default_templates (production)
     4) <project>/default_templates (local dev)
     """
-    return [
-        APP_CUSTOM_DIR,
-        LOCAL_CUSTOM_DIR,
-        APP_DEFAULT_DIR,
-        LOCAL_DEFAULT_DIR,
-    ]
+    return tuple(
+        d for d in (APP_CUSTOM_DIR, LOCAL_CUSTOM_DIR, APP_DEFAULT_DIR, LOCAL_DEFAULT_DIR)
+        if d.is_dir()
+    )
+
+
+# Resolved once at import; template mounts are in place before the server starts
+_TEMPLATE_DIRS = _existing_template_dirs()
+
+
+def _candidate_dirs() -> tuple[Path, ...]:
+    """Return template search directories in priority order (existing ones only)."""
+    return _TEMPLATE_DIRS
 
 
 def _classify_template_source(p: Path) -> str:
@@ -0,0 +1,79 @@
+"""Shared pytest configuration for the test suite."""
+
+import logging
+import os
+import queue
+import threading
+import zipfile
+from pathlib import Path
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+TESTS_DIR = Path(__file__).parent
+
+# Saved .docx outputs (per worker when running under pytest-xdist)
+DOCX_OUTPUT_DIR = TESTS_DIR / "output" / "docx"
+if "PYTEST_XDIST_WORKER" in os.environ:
+    DOCX_OUTPUT_DIR = DOCX_OUTPUT_DIR / os.environ["PYTEST_XDIST_WORKER"]
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--save-outputs",
+        action="store_true",
+        default=os.environ.get("SAVE_OUTPUTS", "").lower() in {"1", "true", "yes"},
+        help="save generated documents under tests/output for manual inspection (default: $SAVE_OUTPUTS)",
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _ensure_dirs(request):
+    """Create the shared test directories once per session."""
+    (TESTS_DIR / "templates").mkdir(exist_ok=True)
+    (TESTS_DIR / "output" / "pptx").mkdir(parents=True, exist_ok=True)
+    if request.config.getoption("--save-outputs"):
+        DOCX_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+
+@pytest.fixture(scope="session")
+def docx_output_writer(request):
+    """Return a ``write(filename, data)`` callable for saved .docx outputs, or None.
+
+    With --save-outputs, files are written to DOCX_OUTPUT_DIR by one background
+    thread so disk I/O overlaps with the next test. The first write error is
+    raised at the end of the session.
+    """
+    if not request.config.getoption("--save-outputs"):
+        yield None
+        return
+
+    # (path, bytes) pairs to write; None stops the writer
+    pending: "queue.Queue[tuple[Path, bytes] | None]" = queue.Queue()
+    errors: list[OSError] = []
+
+    def drain():
+        while (item := pending.get()) is not None:
+            path, data = item
+            try:
+                path.write_bytes(data)
+                logger.info("Saved: %s", path)
+            except OSError as e:
+                errors.append(e)
+
+    writer = threading.Thread(target=drain, name="docx-output-writer", daemon=True)
+    writer.start()
+    yield lambda filename, data: pending.put((DOCX_OUTPUT_DIR / filename, data))
+    pending.put(None)
+    writer.join()
+    if errors:
+        raise errors[0]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _store_docx_uncompressed():
+    """Write .docx packages without deflate; tests never depend on the compressed size."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("docx.opc.phys_pkg.ZIP_DEFLATED", zipfile.ZIP_STORED)
+        yield
@@ -3,133 +3,46 @@
 These tests verify that the markdown to Word conversion works correctly,
 including headers, lists, tables, formatting, links, and block quotes.
 
-Output files are saved to tests/output/docx/ directory for manual inspection.
+Documents are always serialized in memory; pass --save-outputs (or set
+SAVE_OUTPUTS=1) to also save them to the tests/output/docx/ directory for
+manual inspection. Tests are independent of each other and can run in
+parallel with pytest-xdist (``pytest -n auto --dist=loadfile``); each worker
+then writes to its own subdirectory.
 """
 
-import sys
-from pathlib import Path
-
-# Add project root to path for imports
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+import io
+from itertools import islice
 
 import pytest
 from docx import Document
+from docx.oxml.ns import qn
 
-from docx_tools.helpers import (
-    parse_inline_formatting,
-    load_templates,
-    parse_table,
-    add_table_to_doc,
-    process_list_items,
-)
-import re
-
-# Output directory for test files
-OUTPUT_DIR = Path(__file__).parent / "output" / "docx"
+from docx_tools import base_docx_tool
+from docx_tools.base_docx_tool import markdown_to_document, markdown_to_word
+from docx_tools.helpers import parse_inline_formatting
 
+# Writes serialized documents to the output directory with --save-outputs;
+# bound per module from the docx_output_writer session fixture
+_write_output = None
 
-@pytest.fixture(scope="module", autouse=True)
-def setup_output_dir():
-    """Create output directory if it doesn't exist."""
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    yield
-
+# Clark-notation tag of w:t text elements
+W_T = qn("w:t")
 
-def create_word_document(markdown_content: str) -> Document:
-    """Convert Markdown to Word document and return the Document object.
+# Clark-notation tag of w:hyperlink elements
+HYPERLINK_TAG = qn("w:hyperlink")
 
-    This is a test-friendly version that returns the Document directly
-    instead of saving via upload_file.
-    """
-    path = load_templates()
-
-    if path:
-        doc = Document(path)
-    else:
-        doc = Document()
-
-    lines = markdown_content.split('\n')
-    i = 0
-
-    while i < len(lines):
-        line = lines[i]
-
-        if not line.strip():
-            i += 1
-            continue
-
-        # Check if this line ends with two spaces (line break)
-        if line.endswith('  '):
-            paragraph_lines = []
-            while i < len(lines):
-                current_line = lines[i]
-                if not current_line.strip():
-                    break
-                paragraph_lines.append(current_line)
-                i += 1
-                if not current_line.endswith('  '):
-                    break
-
-            full_text = '  \n'.join(paragraph_lines)
-            first_line = paragraph_lines[0].strip()
-
-            if first_line.startswith('#'):
-                header_level = len(first_line) - len(first_line.lstrip('#'))
-                header_text = first_line.lstrip('#').strip()
-                heading = doc.add_heading('', level=min(header_level, 6))
-                parse_inline_formatting(header_text, heading)
-            elif first_line.startswith('>'):
-                quote_text = full_text[1:].strip()
-                quote_paragraph = doc.add_paragraph()
-                quote_paragraph.style = 'Quote'
-                parse_inline_formatting(quote_text, quote_paragraph)
-            else:
-                paragraph = doc.add_paragraph()
-                parse_inline_formatting(full_text, paragraph)
-            continue
-
-        line = line.strip()
-
-        if line.startswith('#'):
-            header_level = len(line) - len(line.lstrip('#'))
-            header_text = line.lstrip('#').strip()
-            heading = doc.add_heading('', level=min(header_level, 6))
-            parse_inline_formatting(header_text, heading)
-            i += 1
-
-        elif line.startswith('|'):
-            table_data, i = parse_table(lines, i)
-            if table_data:
-                add_table_to_doc(table_data, doc)
-
-        elif re.match(r'^\d+\.\s+', line):
-            i = process_list_items(lines, i, doc, True, 0)
-
-        elif re.match(r'^[-*+]\s+', line):
-            i = process_list_items(lines, i, doc, False, 0)
-
-        elif line.startswith('---') or line.startswith('***'):
-            doc.add_paragraph()
-            i += 1
-
-        elif line.startswith('>'):
-            quote_text = line[1:].strip()
-            quote_paragraph = doc.add_paragraph()
-            quote_paragraph.style = 'Quote'
-            parse_inline_formatting(quote_text, quote_paragraph)
-            i += 1
-
-        else:
-            paragraph = doc.add_paragraph()
-            parse_inline_formatting(line, paragraph)
-            i += 1
 
-    return doc
+@pytest.fixture(scope="module", autouse=True)
+def bind_output_writer(docx_output_writer):
+    """Point save helpers at the shared output writer for this module."""
+    global _write_output
+    _write_output = docx_output_writer
+    yield
+    _write_output = None
 
 
 def save_test_document(markdown: str, filename: str) -> Document:
-    """Convert markdown to Word and save directly to test output directory.
+    """Convert markdown to Word, saving to the test output directory if enabled.
 
     Args:
         markdown: Markdown content to convert
@@ -138,10 +51,11 @@ def save_test_document(markdown: str, filename: str) -> Document:
     Returns:
         The generated Document object for assertions
     """
-    doc = create_word_document(markdown)
-    output_path = OUTPUT_DIR / filename
-    doc.save(str(output_path))
-    print(f"Saved: {output_path}")
+    doc = markdown_to_document(markdown)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    if _write_output is not None:
+        _write_output(filename, buffer.getvalue())
     return doc
 
 
@@ -152,23 +66,12 @@ def save_test_document(markdown: str, filename: str) -> Document:
 class TestHeaders:
     """Tests for markdown headers conversion."""
 
-    def test_h1_header(self):
-        """Test H1 header conversion."""
-        markdown = "# Main Title"
-        doc = save_test_document(markdown, "header_h1.docx")
-        assert doc is not None
-
-    def test_h2_header(self):
-        """Test H2 header conversion."""
-        markdown = "## Section Title"
-        doc = save_test_document(markdown, "header_h2.docx")
-        assert doc is not None
-
-    def test_h3_header(self):
-        """Test H3 header conversion."""
-        markdown = "### Subsection Title"
-        doc = save_test_document(markdown, "header_h3.docx")
-        assert doc is not None
+    @pytest.mark.parametrize("level", range(1, 7))
+    def test_header_level(self, level):
+        """Test H1-H6 header conversion."""
+        markdown = "#" * level + " Title"
+        doc = save_test_document(markdown, f"header_h{level}.docx")
+        assert doc.paragraphs[-1].style.name == f"Heading {level}"
 
     def test_multiple_headers(self):
         """Test document with multiple header levels."""
@@ -186,65 +89,41 @@ More details.
 
 Final thoughts.
 """
-        doc = save_test_document(markdown, "header_multiple.docx")
-        assert doc is not None
+        save_test_document(markdown, "header_multiple.docx")
 
     def test_header_with_formatting(self):
         """Test header with inline formatting."""
         markdown = "# Title with **bold** and *italic*"
-        doc = save_test_document(markdown, "header_formatted.docx")
-        assert doc is not None
+        save_test_document(markdown, "header_formatted.docx")
 
 
 # =============================================================================
-# List Tests
+# Simple Conversion Tests
 # =============================================================================
 
-class TestLists:
-    """Tests for markdown list conversion."""
-
-    def test_unordered_list(self):
-        """Test unordered (bullet) list."""
-        markdown = """- First item
+# (output name, markdown) pairs whose only check is that conversion succeeds
+CONVERSION_CASES = [
+    # Lists
+    ("list_unordered", """- First item
 - Second item
 - Third item
-"""
-        doc = save_test_document(markdown, "list_unordered.docx")
-        assert doc is not None
-
-    def test_ordered_list(self):
-        """Test ordered (numbered) list."""
-        markdown = """1. First item
+"""),
+    ("list_ordered", """1. First item
 2. Second item
 3. Third item
-"""
-        doc = save_test_document(markdown, "list_ordered.docx")
-        assert doc is not None
-
-    def test_nested_list(self):
-        """Test nested list items."""
-        markdown = """- Main item 1
+"""),
+    ("list_nested", """- Main item 1
    - Sub item 1.1
    - Sub item 1.2
 - Main item 2
    - Sub item 2.1
-"""
-        doc = save_test_document(markdown, "list_nested.docx")
-        assert doc is not None
-
-    def test_list_with_formatting(self):
-        """Test list items with inline formatting."""
-        markdown = """- **Bold item**
+"""),
+    ("list_formatted", """- **Bold item**
 - *Italic item*
 - Item with `code`
 - Item with [link](https://example.com)
-"""
-        doc = save_test_document(markdown, "list_formatted.docx")
-        assert doc is not None
-
-    def test_mixed_list_types(self):
-        """Test document with both ordered and unordered lists."""
-        markdown = """## Shopping List
+"""),
+    ("list_mixed", """## Shopping List
 
 - Apples
 - Bananas
@@ -255,130 +134,79 @@ class TestLists:
 1. First step
 2. Second step
 3. Third step
-"""
-        doc = save_test_document(markdown, "list_mixed.docx")
-        assert doc is not None
+"""),
 
-
-# =============================================================================
-# Table Tests
-# =============================================================================
-
-class TestTables:
-    """Tests for markdown table conversion."""
-
-    def test_simple_table(self):
-        """Test simple table conversion."""
-        markdown = """| Name | Age | City |
+    # Tables
+    ("table_simple", """| Name | Age | City |
 |------|-----|------|
 | John | 25  | NYC  |
 | Jane | 30  | LA   |
-"""
-        doc = save_test_document(markdown, "table_simple.docx")
-        assert doc is not None
-
-    def test_table_with_formatting(self):
-        """Test table with formatted cells."""
-        markdown = """| Feature | Description |
+"""),
+    ("table_formatted", """| Feature | Description |
 |---------|-------------|
 | **Bold** | This is bold |
 | *Italic* | This is italic |
 | `Code` | This is code |
-"""
-        doc = save_test_document(markdown, "table_formatted.docx")
-        assert doc is not None
-
-    def test_table_with_alignment(self):
-        """Test table with column alignment markers."""
-        markdown = """| Left | Center | Right |
+"""),
+    ("table_aligned", """| Left | Center | Right |
 |:-----|:------:|------:|
 | L1   | C1     | R1    |
 | L2   | C2     | R2    |
-"""
-        doc = save_test_document(markdown, "table_aligned.docx")
-        assert doc is not None
+"""),
 
+    # Inline formatting
+    ("format_bold", "This is **bold** text."),
+    ("format_italic", "This is *italic* text."),
+    ("format_code", "Use the `print()` function."),
+    ("format_link", "Visit [our website](https://example.com) for more info."),
+    ("format_mixed", "This has **bold**, *italic*, `code`, and [link](https://test.com)."),
+    ("format_nested", "This is **bold with *italic* inside**."),
+    ("format_escaped", r"This has \*asterisks\* and \**double asterisks\**."),
 
-# =============================================================================
-# Inline Formatting Tests
-# =============================================================================
+    # Block quotes
+    ("quote_simple", "> This is a quoted text."),
+    ("quote_formatted", "> This quote has **bold** and *italic* text."),
 
-class TestInlineFormatting:
-    """Tests for inline markdown formatting."""
-
-    def test_bold_text(self):
-        """Test bold text conversion."""
-        markdown = "This is **bold** text."
-        doc = save_test_document(markdown, "format_bold.docx")
-        assert doc is not None
-
-    def test_italic_text(self):
-        """Test italic text conversion."""
-        markdown = "This is *italic* text."
-        doc = save_test_document(markdown, "format_italic.docx")
-        assert doc is not None
-
-    def test_inline_code(self):
-        """Test inline code conversion."""
-        markdown = "Use the `print()` function."
-        doc = save_test_document(markdown, "format_code.docx")
-        assert doc is not None
-
-    def test_hyperlink(self):
-        """Test hyperlink conversion."""
-        markdown = "Visit [our website](https://example.com) for more info."
-        doc = save_test_document(markdown, "format_link.docx")
-        assert doc is not None
-
-    def test_mixed_formatting(self):
-        """Test multiple formatting types in one paragraph."""
-        markdown = "This has **bold**, *italic*, `code`, and [link](https://test.com)."
-        doc = save_test_document(markdown, "format_mixed.docx")
-        assert doc is not None
-
-    def test_nested_formatting(self):
-        """Test nested formatting (bold containing italic)."""
-        markdown = "This is **bold with *italic* inside**."
-        doc = save_test_document(markdown, "format_nested.docx")
-        assert doc is not None
-
-    def test_escaped_characters(self):
-        """Test escaped markdown characters."""
-        markdown = r"This has \*asterisks\* and \**double asterisks\**."
-        doc = save_test_document(markdown, "format_escaped.docx")
-        assert doc is not None
+    # Edge cases
+    ("edge_empty_content", ""),
+    ("edge_only_whitespace", "   \n\n   \n"),
+    ("edge_empty_lines", """First paragraph.
 
 
-# =============================================================================
-# Block Quote Tests
-# =============================================================================
+Third paragraph (after two empty lines).
+"""),
+    ("edge_unicode", """# Vícejazyčný dokument
 
-class TestBlockQuotes:
-    """Tests for block quote conversion."""
+Příliš žluťoučký kůň úpěl ďábelské ódy.
 
-    def test_simple_quote(self):
-        """Test simple block quote."""
-        markdown = "> This is a quoted text."
-        doc = save_test_document(markdown, "quote_simple.docx")
-        assert doc is not None
+日本語テキスト
+
+Emoji: 👋 🌍 ✨
+"""),
+    ("edge_xml_chars", "This has < and > and & characters."),
+    ("edge_line_breaks", """This is line one.  
+This is line two (same paragraph).  
+This is line three.
+"""),
+]
 
-    def test_quote_with_formatting(self):
-        """Test block quote with inline formatting."""
-        markdown = "> This quote has **bold** and *italic* text."
-        doc = save_test_document(markdown, "quote_formatted.docx")
-        assert doc is not None
+
+class TestSimpleConversions:
+    """Tests for lists, tables, inline formatting, block quotes and edge cases."""
+
+    @pytest.mark.parametrize(
+        "name,markdown", CONVERSION_CASES, ids=[c[0] for c in CONVERSION_CASES]
+    )
+    def test_conversion(self, name, markdown):
+        """Test that the markdown converts and saves as <name>.docx."""
+        save_test_document(markdown, f"{name}.docx")
 
 
 # =============================================================================
 # Complex Document Tests
 # =============================================================================
 
-class TestComplexDocuments:
-    """Tests for complex documents combining multiple elements."""
-
-    def test_full_document(self):
-        """Test a complete document with all elements."""
-        markdown = """# Project Report
+FULL_DOCUMENT_MARKDOWN = """# Project Report
 
 ## Executive Summary
 
@@ -411,12 +239,8 @@ The following points summarize our findings:
 
 Visit [our dashboard](https://example.com/dashboard) for live updates.
 """
-        doc = save_test_document(markdown, "complex_full_document.docx")
-        assert doc is not None
 
-    def test_legal_contract_style(self):
-        """Test legal contract style document with numbered sections."""
-        markdown = """# SERVICE AGREEMENT
+CONTRACT_MARKDOWN = """# SERVICE AGREEMENT
 
 1. PARTIES
    - This agreement is between Company A and Company B.
@@ -434,12 +258,8 @@ Visit [our dashboard](https://example.com/dashboard) for live updates.
    - Both parties agree to maintain confidentiality.
    - This obligation survives termination of the agreement.
 """
-        doc = save_test_document(markdown, "complex_contract.docx")
-        assert doc is not None
 
-    def test_technical_documentation(self):
-        """Test technical documentation style."""
-        markdown = """# API Documentation
+API_DOCS_MARKDOWN = """# API Documentation
 
 ## Authentication
 
@@ -470,172 +290,119 @@ Creates a new user.
 - `email` - User's email address
 - `role` - User's role (*admin*, *user*, or *guest*)
 """
-        doc = save_test_document(markdown, "complex_api_docs.docx")
-        assert doc is not None
 
+COMPLEX_DOCUMENT_CASES = [
+    ("complex_full_document", FULL_DOCUMENT_MARKDOWN),
+    ("complex_contract", CONTRACT_MARKDOWN),
+    ("complex_api_docs", API_DOCS_MARKDOWN),
+]
 
-# =============================================================================
-# Edge Cases
-# =============================================================================
 
-class TestEdgeCases:
-    """Tests for edge cases and special scenarios."""
+class TestComplexDocuments:
+    """Tests for complex documents combining multiple elements."""
 
-    def test_empty_content(self):
-        """Test with empty content."""
-        markdown = ""
-        doc = save_test_document(markdown, "edge_empty_content.docx")
-        assert doc is not None
+    @pytest.mark.parametrize(
+        "name,markdown", COMPLEX_DOCUMENT_CASES, ids=[c[0] for c in COMPLEX_DOCUMENT_CASES]
+    )
+    def test_complex_document(self, name, markdown):
+        """Test a full report, a numbered legal contract and API documentation."""
+        save_test_document(markdown, f"{name}.docx")
 
-    def test_only_whitespace(self):
-        """Test with only whitespace."""
-        markdown = "   \n\n   \n"
-        doc = save_test_document(markdown, "edge_only_whitespace.docx")
-        assert doc is not None
 
-    def test_multiple_empty_lines(self):
-        """Test preservation of multiple empty lines."""
-        markdown = """First paragraph.
+# =============================================================================
+# Edge Cases
+# =============================================================================
 
+LONG_PARAGRAPH_MARKDOWN = "# Long Document\n\n" + "Lorem ipsum dolor sit amet. " * 50
 
-Third paragraph (after two empty lines).
-"""
-        doc = save_test_document(markdown, "edge_empty_lines.docx")
-        assert doc is not None
 
-    def test_unicode_content(self):
-        """Test with unicode characters."""
-        markdown = """# Vícejazyčný dokument
+class TestEdgeCases:
+    """Tests for edge cases and special scenarios."""
 
-Příliš žluťoučký kůň úpěl ďábelské ódy.
+    def test_long_paragraph(self):
+        """Test with very long paragraph."""
+        save_test_document(LONG_PARAGRAPH_MARKDOWN, "edge_long_paragraph.docx")
 
-日本語テキスト
+    def test_template_error_is_not_reported_as_parse_error(self, monkeypatch):
+        """Test that a broken Word template gets its own error message."""
+        def broken_template(path):
+            raise ValueError("file is not a zip file")
 
-Emoji: 👋 🌍 ✨
-"""
-        doc = save_test_document(markdown, "edge_unicode.docx")
-        assert doc is not None
+        monkeypatch.setattr(base_docx_tool, "load_templates", lambda: "broken.docx")
+        monkeypatch.setattr(base_docx_tool, "open_template", broken_template)
 
-    def test_long_paragraph(self):
-        """Test with very long paragraph."""
-        long_text = "Lorem ipsum dolor sit amet. " * 50
-        markdown = f"# Long Document\n\n{long_text}"
-        doc = save_test_document(markdown, "edge_long_paragraph.docx")
-        assert doc is not None
-
-    def test_special_xml_characters(self):
-        """Test with characters that need XML escaping."""
-        markdown = "This has < and > and & characters."
-        doc = save_test_document(markdown, "edge_xml_chars.docx")
-        assert doc is not None
-
-    def test_line_breaks(self):
-        """Test soft line breaks (two spaces at end)."""
-        markdown = """This is line one.  
-This is line two (same paragraph).  
-This is line three.
-"""
-        doc = save_test_document(markdown, "edge_line_breaks.docx")
-        assert doc is not None
+        assert markdown_to_word("# Title") == "Error loading Word template: file is not a zip file"
 
 
 # =============================================================================
 # Regression Tests for helpers.py changes
 # =============================================================================
 
+@pytest.fixture(scope="class")
+def shared_doc():
+    """One Document per test class; each test adds and checks only its own paragraph."""
+    return Document()
+
+
 class TestHelpersRegression:
     """Regression tests for helpers.py functionality used by base tool."""
 
-    def test_parse_inline_formatting_plain(self):
+    def test_parse_inline_formatting_plain(self, shared_doc):
         """Test parse_inline_formatting with plain text."""
-        doc = Document()
-        para = doc.add_paragraph()
+        para = shared_doc.add_paragraph()
         parse_inline_formatting("Plain text", para)
         assert para.text == "Plain text"
 
-    def test_parse_inline_formatting_bold(self):
+    def test_parse_inline_formatting_bold(self, shared_doc):
         """Test parse_inline_formatting with bold."""
-        doc = Document()
-        para = doc.add_paragraph()
+        para = shared_doc.add_paragraph()
         parse_inline_formatting("Text with **bold** word", para)
         assert "bold" in para.text
-        bold_runs = [r for r in para.runs if r.bold]
-        assert len(bold_runs) > 0
+        assert any(r.bold for r in para.runs)
 
-    def test_parse_inline_formatting_italic(self):
+    def test_parse_inline_formatting_italic(self, shared_doc):
         """Test parse_inline_formatting with italic."""
-        doc = Document()
-        para = doc.add_paragraph()
+        para = shared_doc.add_paragraph()
         parse_inline_formatting("Text with *italic* word", para)
         assert "italic" in para.text
-        italic_runs = [r for r in para.runs if r.italic]
-        assert len(italic_runs) > 0
+        assert any(r.italic for r in para.runs)
 
-    def test_parse_inline_formatting_code(self):
+    def test_parse_inline_formatting_code(self, shared_doc):
         """Test parse_inline_formatting with inline code."""
-        doc = Document()
-        para = doc.add_paragraph()
+        para = shared_doc.add_paragraph()
         parse_inline_formatting("Use `code` here", para)
         assert "code" in para.text
-        code_runs = [r for r in para.runs if r.font.name == "Courier New"]
-        assert len(code_runs) > 0
+        assert any(r.font.name == "Courier New" for r in para.runs)
 
-    def test_parse_inline_formatting_link(self):
+    def test_parse_inline_formatting_link(self, shared_doc):
         """Test parse_inline_formatting with hyperlink."""
-        doc = Document()
-        para = doc.add_paragraph()
+        para = shared_doc.add_paragraph()
         parse_inline_formatting("Visit [link](https://example.com)", para)
         # Check that hyperlink element exists
-        hyperlinks = para._p.findall('.//{http://schemas.openxmlformats.org/wordprocessingml/2006/main}hyperlink')
-        assert len(hyperlinks) > 0
+        assert next(para._p.iter(HYPERLINK_TAG), None) is not None
 
-    def test_parse_inline_formatting_nested(self):
+    def test_parse_inline_formatting_nested(self, shared_doc):
         """Test parse_inline_formatting with nested formatting."""
-        doc = Document()
-        para = doc.add_paragraph()
+        para = shared_doc.add_paragraph()
         parse_inline_formatting("This is **bold with *italic* inside**", para)
 
         # Should have runs with both bold and italic
-        bold_italic_runs = [r for r in para.runs if r.bold and r.italic]
-        assert len(bold_italic_runs) > 0
+        assert any(r.bold and r.italic for r in para.runs)
 
-    def test_parse_inline_formatting_multiple_bold(self):
+    def test_parse_inline_formatting_multiple_bold(self, shared_doc):
         """Test parse_inline_formatting with multiple bold sections."""
-        doc = Document()
-        para = doc.add_paragraph()
+        para = shared_doc.add_paragraph()
         parse_inline_formatting("**First** and **second** bold", para)
 
-        bold_runs = [r for r in para.runs if r.bold and r.text.strip()]
-        assert len(bold_runs) >= 2
+        bold_runs = (r for r in para.runs if r.bold and r.text.strip())
+        assert len(list(islice(bold_runs, 2))) == 2
 
 
 # =============================================================================
 # Comprehensive Visual Test
 # =============================================================================
 
-class TestVisualInspection:
-    """Comprehensive test for manual visual inspection of generated documents.
-
-    This test creates a single document with ALL supported markdown features
-    for easy visual verification in Word/LibreOffice.
-
-    Output: tests/output/docx/base/VISUAL_INSPECTION_comprehensive.docx
-    """
-
-    def test_comprehensive_visual_document(self):
-        """Generate a comprehensive document for visual inspection.
-
-        This document includes:
-        - All heading levels (H1-H6)
-        - Paragraphs with various inline formatting
-        - Ordered and unordered lists (including nested)
-        - Tables with formatting
-        - Block quotes
-        - Hyperlinks
-        - Unicode and special characters
-        - Line breaks
-        """
-        markdown = """# Comprehensive Visual Inspection Document
+VISUAL_INSPECTION_MARKDOWN = """# Comprehensive Visual Inspection Document
 
 This document is designed for **manual visual inspection** to verify that all markdown 
 features are correctly converted to Word format. Open this file in Microsoft Word or 
@@ -855,14 +622,38 @@ working properly! 🎉
 
 *Last updated: January 2026*
 """
-        doc = save_test_document(markdown, "VISUAL_INSPECTION_comprehensive.docx")
-        assert doc is not None
+
+
+class TestVisualInspection:
+    """Comprehensive test for manual visual inspection of generated documents.
+
+    This test creates a single document with ALL supported markdown features
+    for easy visual verification in Word/LibreOffice.
+
+    Output (with --save-outputs): tests/output/docx/VISUAL_INSPECTION_comprehensive.docx,
+    or tests/output/docx/<worker>/ when running under pytest-xdist.
+    """
+
+    def test_comprehensive_visual_document(self):
+        """Generate a comprehensive document for visual inspection.
+
+        This document includes:
+        - All heading levels (H1-H6)
+        - Paragraphs with various inline formatting
+        - Ordered and unordered lists (including nested)
+        - Tables with formatting
+        - Block quotes
+        - Hyperlinks
+        - Unicode and special characters
+        - Line breaks
+        """
+        doc = save_test_document(VISUAL_INSPECTION_MARKDOWN, "VISUAL_INSPECTION_comprehensive.docx")
 
         # Basic sanity checks
         assert len(doc.paragraphs) > 50, "Document should have many paragraphs"
 
-        # Check for various elements in paragraphs
-        full_text = "\n".join([p.text for p in doc.paragraphs])
+        # Collect body text (paragraphs and table cells) in a single walk
+        full_text = "".join(t.text or "" for t in doc.element.body.iter(W_T))
         assert "Comprehensive Visual Inspection" in full_text
         assert "bold text" in full_text
         assert "italic text" in full_text
@@ -872,13 +663,7 @@ working properly! 🎉
 
         # Check tables exist and have content
         assert len(doc.tables) >= 3, "Document should have at least 3 tables"
-        # Check table content
-        table_text = ""
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    table_text += cell.text + " "
-        assert "John" in table_text  # From simple table
+        assert "John" in full_text  # Only appears in the simple table
 
 
 if __name__ == "__main__":
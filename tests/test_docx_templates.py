@@ -1,7 +1,10 @@
 """Tests for dynamic DOCX template creation.
 
-These tests create actual .docx files and save them to disk for manual inspection.
-Output files are saved to tests/output/docx/ directory.
+These tests create actual .docx files. By default they are kept in memory;
+pass --save-outputs (or set SAVE_OUTPUTS=1) to also save them to the
+tests/output/docx/ directory for manual inspection. Tests are independent
+and can run in parallel with pytest-xdist (``pytest -n auto``); each worker
+then writes to its own subdirectory.
 
 Test coverage:
 - Basic placeholder replacement
@@ -14,67 +17,92 @@ Test coverage:
 - Template registration from YAML
 """
 
-import sys
+import io
+from collections import namedtuple
+from functools import lru_cache
 from pathlib import Path
 
-# Add project root to path for imports
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
 import pytest
 from docx import Document
 from docx.shared import Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml.ns import qn
 
 from docx_tools.dynamic_docx_tools import (
     _replace_placeholders_in_paragraph,
     _replace_placeholders_in_document,
     find_docx_template_by_name,
+    render_docx_template,
 )
 from docx_tools.helpers import contains_block_markdown
+from template_utils import YAML_LOADER
+
+# Clark-notation tag of w:hyperlink elements
+HYPERLINK_TAG = qn("w:hyperlink")
 
-# Output directory for test files
-OUTPUT_DIR = Path(__file__).parent / "output" / "docx"
-TEMPLATES_DIR = Path(__file__).parent / "templates"
+# Writes serialized documents to the output directory with --save-outputs;
+# bound per module from the docx_output_writer session fixture
+_write_output = None
 
 
 @pytest.fixture(scope="module", autouse=True)
-def setup_output_dir():
-    """Create output directory if it doesn't exist."""
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    TEMPLATES_DIR.mkdir(parents=True, exist_ok=True)
+def bind_output_writer(docx_output_writer):
+    """Point save helpers at the shared output writer for this module."""
+    global _write_output
+    _write_output = docx_output_writer
     yield
+    _write_output = None
+
+
+def save_document(doc: Document, filename: str) -> io.BytesIO:
+    """Serialize document to an in-memory buffer, also queueing it to disk with --save-outputs."""
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    if _write_output is not None:
+        _write_output(filename, buffer.getvalue())
+    buffer.seek(0)
+    return buffer
 
 
-def save_document(doc: Document, filename: str) -> Path:
-    """Save document to output directory and return path."""
-    output_path = OUTPUT_DIR / filename
-    doc.save(str(output_path))
-    print(f"Saved: {output_path}")
-    return output_path
+@lru_cache(maxsize=1)
+def _default_docx_bytes() -> bytes:
+    """Serialize python-docx's default template once per session."""
+    buffer = io.BytesIO()
+    Document().save(buffer)
+    return buffer.getvalue()
+
+
+def new_document() -> Document:
+    """Return a fresh blank document loaded from the cached default template."""
+    return Document(io.BytesIO(_default_docx_bytes()))
 
 
 def create_test_document_with_placeholder(placeholder: str, font_size: int = 11) -> Document:
     """Create a simple test document with a single placeholder."""
-    doc = Document()
+    doc = new_document()
     para = doc.add_paragraph()
     run = para.add_run(placeholder)
     run.font.size = Pt(font_size)
     return doc
 
 
-def get_paragraph_runs_info(paragraph) -> list:
-    """Get info about all runs in a paragraph including formatting."""
-    runs_info = []
-    for run in paragraph.runs:
-        info = {
-            "text": run.text,
-            "bold": run.bold,
-            "italic": run.italic,
-            "font_name": run.font.name,
-        }
-        runs_info.append(info)
-    return runs_info
+def has_hyperlink(paragraph) -> bool:
+    """Return True if the paragraph contains a w:hyperlink element."""
+    return next(paragraph._p.iter(HYPERLINK_TAG), None) is not None
+
+
+# Text and formatting of a single run, as read by get_paragraph_runs_info
+RunInfo = namedtuple("RunInfo", "text bold italic font_name")
+
+
+def get_paragraph_runs_info(paragraph) -> list[RunInfo]:
+    """Get text and formatting of every run in a paragraph."""
+    return [RunInfo(r.text, r.bold, r.italic, r.font.name) for r in paragraph.runs]
+
+
+def get_styled_paragraphs(doc: Document) -> list[tuple[str, str]]:
+    """Get (style name, text) of every non-empty body paragraph."""
+    return [(p.style.name, p.text) for p in doc.paragraphs if p.text]
 
 
 # =============================================================================
@@ -84,6 +112,12 @@ def get_paragraph_runs_info(paragraph) -> list:
 class TestBasicPlaceholderReplacement:
     """Tests for basic placeholder replacement functionality."""
 
+    GREETING_CONTEXT = {
+        "title": "Mr.",
+        "name": "Smith",
+        "company": "Acme Corp"
+    }
+
     def test_simple_placeholder_replacement(self):
         """Test replacing a simple placeholder with plain text."""
         doc = create_test_document_with_placeholder("Hello {{name}}!")
@@ -91,33 +125,24 @@ class TestBasicPlaceholderReplacement:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "basic_01_simple_replacement.docx")
-        assert path.exists()
+        buf = save_document(doc, "basic_01_simple_replacement.docx")
 
         # Verify content
-        doc2 = Document(path)
+        doc2 = Document(buf)
         assert "World" in doc2.paragraphs[0].text
         assert "{{name}}" not in doc2.paragraphs[0].text
 
     def test_multiple_placeholders_same_paragraph(self):
         """Test replacing multiple placeholders in the same paragraph."""
-        doc = Document()
+        doc = new_document()
         para = doc.add_paragraph()
         para.add_run("Dear {{title}} {{name}}, welcome to {{company}}!")
 
-        context = {
-            "title": "Mr.",
-            "name": "Smith",
-            "company": "Acme Corp"
-        }
-
-        _replace_placeholders_in_document(doc, context)
+        _replace_placeholders_in_document(doc, self.GREETING_CONTEXT)
 
-        path = save_document(doc, "basic_02_multiple_placeholders.docx")
-        assert path.exists()
+        save_document(doc, "basic_02_multiple_placeholders.docx")
 
-        doc2 = Document(path)
-        text = doc2.paragraphs[0].text
+        text = doc.paragraphs[0].text
         assert "Mr." in text
         assert "Smith" in text
         assert "Acme Corp" in text
@@ -129,8 +154,9 @@ class TestBasicPlaceholderReplacement:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "basic_03_placeholder_at_start.docx")
-        assert path.exists()
+        save_document(doc, "basic_03_placeholder_at_start.docx")
+
+        assert doc.paragraphs[0].text == "Hello everyone!"
 
     def test_placeholder_at_end(self):
         """Test placeholder at the end of paragraph."""
@@ -139,8 +165,9 @@ class TestBasicPlaceholderReplacement:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "basic_04_placeholder_at_end.docx")
-        assert path.exists()
+        save_document(doc, "basic_04_placeholder_at_end.docx")
+
+        assert doc.paragraphs[0].text == "Best regards, John Doe"
 
     def test_placeholder_only(self):
         """Test paragraph containing only a placeholder."""
@@ -149,8 +176,9 @@ class TestBasicPlaceholderReplacement:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "basic_05_placeholder_only.docx")
-        assert path.exists()
+        save_document(doc, "basic_05_placeholder_only.docx")
+
+        assert doc.paragraphs[0].text == "This is the entire content."
 
     def test_empty_replacement_value(self):
         """Test replacing placeholder with empty string."""
@@ -159,8 +187,9 @@ class TestBasicPlaceholderReplacement:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "basic_06_empty_replacement.docx")
-        assert path.exists()
+        save_document(doc, "basic_06_empty_replacement.docx")
+
+        assert doc.paragraphs[0].text == "Hello World"
 
     def test_missing_placeholder_in_context(self):
         """Test that missing placeholders are left unchanged."""
@@ -169,12 +198,10 @@ class TestBasicPlaceholderReplacement:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "basic_07_missing_placeholder.docx")
-        assert path.exists()
+        save_document(doc, "basic_07_missing_placeholder.docx")
 
         # Verify placeholder is still there
-        doc2 = Document(path)
-        assert "{{unknown_placeholder}}" in doc2.paragraphs[0].text
+        assert "{{unknown_placeholder}}" in doc.paragraphs[0].text
 
 
 # =============================================================================
@@ -184,136 +211,56 @@ class TestBasicPlaceholderReplacement:
 class TestMarkdownFormatting:
     """Tests for markdown formatting support in placeholder values."""
 
-    def test_bold_text(self):
-        """Test bold text formatting (**text**)."""
-        doc = create_test_document_with_placeholder("{{message}}")
-        context = {"message": "This is **bold** text"}
-
-        _replace_placeholders_in_document(doc, context)
-
-        path = save_document(doc, "markdown_01_bold.docx")
-        assert path.exists()
-
-        # Verify formatting
-        doc2 = Document(path)
-        runs = get_paragraph_runs_info(doc2.paragraphs[0])
-        bold_runs = [r for r in runs if r["bold"] and r["text"].strip()]
-        assert len(bold_runs) > 0
-        assert any("bold" in r["text"] for r in bold_runs)
-
-    def test_italic_text(self):
-        """Test italic text formatting (*text*)."""
-        doc = create_test_document_with_placeholder("{{message}}")
-        context = {"message": "This is *italic* text"}
-
-        _replace_placeholders_in_document(doc, context)
-
-        path = save_document(doc, "markdown_02_italic.docx")
-        assert path.exists()
-
-        # Verify formatting
-        doc2 = Document(path)
-        runs = get_paragraph_runs_info(doc2.paragraphs[0])
-        italic_runs = [r for r in runs if r["italic"] and r["text"].strip()]
-        assert len(italic_runs) > 0
-
-    def test_inline_code(self):
-        """Test inline code formatting (`code`)."""
-        doc = create_test_document_with_placeholder("{{message}}")
-        context = {"message": "Use the `print()` function"}
-
-        _replace_placeholders_in_document(doc, context)
-
-        path = save_document(doc, "markdown_03_code.docx")
-        assert path.exists()
-
-        # Verify code uses monospace font
-        doc2 = Document(path)
-        runs = get_paragraph_runs_info(doc2.paragraphs[0])
-        code_runs = [r for r in runs if r["font_name"] == "Courier New"]
-        assert len(code_runs) > 0
-
-    def test_hyperlink(self):
-        """Test hyperlink formatting [text](url)."""
-        doc = create_test_document_with_placeholder("{{message}}")
-        context = {"message": "Visit [our website](https://example.com) for more info"}
-
-        _replace_placeholders_in_document(doc, context)
-
-        path = save_document(doc, "markdown_04_hyperlink.docx")
-        assert path.exists()
-
-        # Verify hyperlink exists - check the XML for hyperlink element
-        doc2 = Document(path)
-        para = doc2.paragraphs[0]
-        hyperlinks = para._p.findall('.//{http://schemas.openxmlformats.org/wordprocessingml/2006/main}hyperlink')
-        assert len(hyperlinks) > 0
-
-    def test_mixed_formatting(self):
-        """Test multiple formatting types in one value."""
-        doc = create_test_document_with_placeholder("{{message}}")
-        context = {
-            "message": "This has **bold**, *italic*, `code`, and [link](https://test.com)"
-        }
-
-        _replace_placeholders_in_document(doc, context)
-
-        path = save_document(doc, "markdown_05_mixed_formatting.docx")
-        assert path.exists()
-
-    def test_nested_formatting(self):
-        """Test nested formatting - bold containing italic."""
-        doc = create_test_document_with_placeholder("{{message}}")
-        context = {"message": "This is **bold with *italic* inside**"}
-
-        _replace_placeholders_in_document(doc, context)
-
-        path = save_document(doc, "markdown_06_nested.docx")
-        assert path.exists()
-
-        # Verify nested formatting is applied correctly
-        doc2 = Document(path)
-        runs = get_paragraph_runs_info(doc2.paragraphs[0])
-
-        # Should have: plain "This is ", bold "bold with ", bold+italic "italic", bold " inside"
-        bold_runs = [r for r in runs if r["bold"] and r["text"].strip()]
-        italic_runs = [r for r in runs if r["italic"] and r["text"].strip()]
-        bold_italic_runs = [r for r in runs if r["bold"] and r["italic"] and r["text"].strip()]
-
-        assert len(bold_runs) >= 1, "Should have bold text"
-        assert len(italic_runs) >= 1, "Should have italic text"
-        assert len(bold_italic_runs) >= 1, "Should have bold+italic text (nested)"
-        assert any("italic" in r["text"] for r in bold_italic_runs), "The word 'italic' should be bold+italic"
-
-    def test_nested_italic_containing_bold(self):
-        """Test nested formatting - italic containing bold."""
+    # Columns: output name, placeholder value, then the text expected in a
+    # bold / italic / bold+italic / code run (None = not checked) and whether
+    # a hyperlink must be present
+    FORMATTING_CASES = [
+        ("markdown_01_bold", "This is **bold** text",
+         "bold", None, None, None, False),
+        ("markdown_02_italic", "This is *italic* text",
+         None, "italic", None, None, False),
+        ("markdown_03_code", "Use the `print()` function",
+         None, None, None, "print()", False),
+        ("markdown_04_hyperlink", "Visit [our website](https://example.com) for more info",
+         None, None, None, None, True),
+        ("markdown_05_mixed_formatting", "This has **bold**, *italic*, `code`, and [link](https://test.com)",
+         "bold", "italic", None, "code", True),
+        ("markdown_06_nested", "This is **bold with *italic* inside**",
+         "bold with", "italic", "italic", None, False),
+        ("markdown_06b_nested_italic_bold", "This is *italic with **bold** inside*",
+         "bold", "italic with", "bold", None, False),
+        ("markdown_07_multiple_bold", "**First** and **second** and **third** bold words",
+         "third", None, None, None, False),
+    ]
+
+    @pytest.mark.parametrize(
+        "name,value,bold_text,italic_text,bold_italic_text,code_text,has_link",
+        FORMATTING_CASES,
+        ids=[c[0] for c in FORMATTING_CASES],
+    )
+    def test_formatting(self, name, value, bold_text, italic_text, bold_italic_text, code_text, has_link):
+        """Test bold, italic, nested, code and link formatting in placeholder values."""
         doc = create_test_document_with_placeholder("{{message}}")
-        context = {"message": "This is *italic with **bold** inside*"}
-
-        _replace_placeholders_in_document(doc, context)
-
-        path = save_document(doc, "markdown_06b_nested_italic_bold.docx")
-        assert path.exists()
 
-        # Verify nested formatting
-        doc2 = Document(path)
-        runs = get_paragraph_runs_info(doc2.paragraphs[0])
-        bold_italic_runs = [r for r in runs if r["bold"] and r["italic"] and r["text"].strip()]
-        assert len(bold_italic_runs) >= 1, "Should have bold+italic text (nested)"
+        _replace_placeholders_in_document(doc, {"message": value})
 
-    def test_multiple_bold_sections(self):
-        """Test multiple bold sections in one value."""
-        doc = create_test_document_with_placeholder("{{message}}")
-        context = {"message": "**First** and **second** and **third** bold words"}
-
-        _replace_placeholders_in_document(doc, context)
+        save_document(doc, f"{name}.docx")
 
-        path = save_document(doc, "markdown_07_multiple_bold.docx")
-        assert path.exists()
+        runs = get_paragraph_runs_info(doc.paragraphs[0])
+        if bold_text:
+            assert any(r.bold and bold_text in r.text for r in runs)
+        if italic_text:
+            assert any(r.italic and italic_text in r.text for r in runs)
+        if bold_italic_text:
+            assert any(r.bold and r.italic and bold_italic_text in r.text for r in runs)
+        if code_text:
+            assert any(r.font_name == "Courier New" and code_text in r.text for r in runs)
+        if has_link:
+            assert has_hyperlink(doc.paragraphs[0])
 
     def test_formatting_preserves_base_font(self):
         """Test that markdown formatting preserves the original font size."""
-        doc = Document()
+        doc = new_document()
         para = doc.add_paragraph()
         run = para.add_run("{{message}}")
         run.font.size = Pt(14)  # Set specific font size
@@ -322,8 +269,12 @@ class TestMarkdownFormatting:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "markdown_08_preserve_font.docx")
-        assert path.exists()
+        save_document(doc, "markdown_08_preserve_font.docx")
+
+        runs = doc.paragraphs[0].runs
+        assert doc.paragraphs[0].text == "Text with bold formatting"
+        assert all(r.font.size == Pt(14) for r in runs)
+        assert any(r.bold and r.text == "bold" for r in runs)
 
 
 # =============================================================================
@@ -333,9 +284,11 @@ class TestMarkdownFormatting:
 class TestTablePlaceholders:
     """Tests for placeholders in tables."""
 
+    GRID_CONTEXT = {f"cell_{i}_{j}": f"R{i}C{j}" for i in range(3) for j in range(3)}
+
     def test_placeholder_in_table_cell(self):
         """Test placeholder replacement in a table cell."""
-        doc = Document()
+        doc = new_document()
         table = doc.add_table(rows=2, cols=2)
         table.style = 'Table Grid'
 
@@ -354,12 +307,14 @@ class TestTablePlaceholders:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "table_01_simple.docx")
-        assert path.exists()
+        save_document(doc, "table_01_simple.docx")
+
+        assert table.cell(1, 0).text == "Company"
+        assert table.cell(1, 1).text == "Acme Corp"
 
     def test_markdown_in_table_cell(self):
         """Test markdown formatting in table cells."""
-        doc = Document()
+        doc = new_document()
         table = doc.add_table(rows=2, cols=2)
         table.style = 'Table Grid'
 
@@ -375,26 +330,31 @@ class TestTablePlaceholders:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "table_02_markdown.docx")
-        assert path.exists()
+        save_document(doc, "table_02_markdown.docx")
+
+        feature_runs = get_paragraph_runs_info(table.cell(1, 0).paragraphs[0])
+        description_runs = get_paragraph_runs_info(table.cell(1, 1).paragraphs[0])
+        assert table.cell(1, 0).text == "Bold Feature"
+        assert table.cell(1, 1).text == "This is very important"
+        assert all(r.bold for r in feature_runs)
+        assert any(r.italic and r.text == "very" for r in description_runs)
 
     def test_multiple_placeholders_in_table(self):
         """Test multiple placeholders across table cells."""
-        doc = Document()
+        doc = new_document()
         table = doc.add_table(rows=3, cols=3)
         table.style = 'Table Grid'
 
-        # Fill with placeholders
-        for i in range(3):
-            for j in range(3):
-                table.cell(i, j).text = f"{{{{cell_{i}_{j}}}}}"
+        # Fill with placeholders; GRID_CONTEXT keys are in row-major order
+        cells = (cell for row in table.rows for cell in row.cells)
+        for cell, key in zip(cells, self.GRID_CONTEXT):
+            cell.text = f"{{{{{key}}}}}"
 
-        context = {f"cell_{i}_{j}": f"R{i}C{j}" for i in range(3) for j in range(3)}
+        _replace_placeholders_in_document(doc, self.GRID_CONTEXT)
 
-        _replace_placeholders_in_document(doc, context)
+        save_document(doc, "table_03_multiple.docx")
 
-        path = save_document(doc, "table_03_multiple.docx")
-        assert path.exists()
+        assert [cell.text for row in table.rows for cell in row.cells] == list(self.GRID_CONTEXT.values())
 
 
 # =============================================================================
@@ -406,7 +366,7 @@ class TestHeaderFooterPlaceholders:
 
     def test_placeholder_in_header(self):
         """Test placeholder replacement in document header."""
-        doc = Document()
+        doc = new_document()
 
         # Add a section with header
         section = doc.sections[0]
@@ -421,12 +381,13 @@ class TestHeaderFooterPlaceholders:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "header_01_simple.docx")
-        assert path.exists()
+        save_document(doc, "header_01_simple.docx")
+
+        assert header_para.text == "Document: Annual Report 2026"
 
     def test_placeholder_in_footer(self):
         """Test placeholder replacement in document footer."""
-        doc = Document()
+        doc = new_document()
 
         # Add a section with footer
         section = doc.sections[0]
@@ -444,12 +405,13 @@ class TestHeaderFooterPlaceholders:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "footer_01_simple.docx")
-        assert path.exists()
+        save_document(doc, "footer_01_simple.docx")
+
+        assert footer_para.text == "© 2026 Test Company"
 
     def test_markdown_in_header(self):
         """Test markdown formatting in header."""
-        doc = Document()
+        doc = new_document()
 
         section = doc.sections[0]
         header = section.header
@@ -462,8 +424,12 @@ class TestHeaderFooterPlaceholders:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "header_02_markdown.docx")
-        assert path.exists()
+        save_document(doc, "header_02_markdown.docx")
+
+        runs = get_paragraph_runs_info(header_para)
+        assert header_para.text == "Important Document - Confidential"
+        assert any(r.bold and r.text == "Important Document" for r in runs)
+        assert any(r.italic and r.text == "Confidential" for r in runs)
 
 
 # =============================================================================
@@ -480,11 +446,9 @@ class TestUnicodeAndSpecialCharacters:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "unicode_01_czech.docx")
-        assert path.exists()
+        save_document(doc, "unicode_01_czech.docx")
 
-        doc2 = Document(path)
-        assert "žluťoučký" in doc2.paragraphs[0].text
+        assert "žluťoučký" in doc.paragraphs[0].text
 
     def test_emoji_in_replacement(self):
         """Test replacement with emoji characters."""
@@ -493,8 +457,9 @@ class TestUnicodeAndSpecialCharacters:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "unicode_02_emoji.docx")
-        assert path.exists()
+        save_document(doc, "unicode_02_emoji.docx")
+
+        assert doc.paragraphs[0].text == "Hello 👋 World 🌍!"
 
     def test_special_xml_characters(self):
         """Test replacement with characters that need XML escaping."""
@@ -503,8 +468,9 @@ class TestUnicodeAndSpecialCharacters:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "unicode_03_xml_special.docx")
-        assert path.exists()
+        save_document(doc, "unicode_03_xml_special.docx")
+
+        assert doc.paragraphs[0].text == "5 > 3 and 2 < 4 and A & B"
 
     def test_multiline_replacement(self):
         """Test replacement with newline characters."""
@@ -513,8 +479,9 @@ class TestUnicodeAndSpecialCharacters:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "unicode_04_multiline.docx")
-        assert path.exists()
+        save_document(doc, "unicode_04_multiline.docx")
+
+        assert doc.paragraphs[0].text == context["address"]
 
     def test_japanese_characters(self):
         """Test replacement with Japanese characters."""
@@ -523,8 +490,11 @@ class TestUnicodeAndSpecialCharacters:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "unicode_05_japanese.docx")
-        assert path.exists()
+        save_document(doc, "unicode_05_japanese.docx")
+
+        assert doc.paragraphs[0].text == "こんにちは世界"
+
+        assert doc.paragraphs[0].text == "こんにちは世界"
 
 
 # =============================================================================
@@ -536,7 +506,7 @@ class TestComplexDocuments:
 
     def test_formal_letter_template(self):
         """Test a complete formal letter template."""
-        doc = Document()
+        doc = new_document()
 
         # Date (right-aligned)
         date_para = doc.add_paragraph()
@@ -596,12 +566,25 @@ class TestComplexDocuments:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "complex_01_formal_letter.docx")
-        assert path.exists()
+        save_document(doc, "complex_01_formal_letter.docx")
+
+        texts = [p.text for p in doc.paragraphs]
+        assert texts[0] == "January 4, 2026"
+        assert doc.paragraphs[0].alignment == WD_ALIGN_PARAGRAPH.RIGHT
+        assert "Hlavní 123\n110 00 Praha 1" in texts
+        assert "Subject: Partnership Proposal" in texts
+        assert texts[-2:] == ["John Smith", "Chief Executive Officer"]
+        assert not any("{{" in text for text in texts)
+
+        body = next(p for p in doc.paragraphs if p.text.startswith("I am writing"))
+        runs = get_paragraph_runs_info(body)
+        assert any(r.bold and r.text == "strategic partnership" for r in runs)
+        assert any(r.italic and r.text == "leverage synergies" for r in runs)
+        assert has_hyperlink(body)
 
     def test_invoice_template(self):
         """Test an invoice-like template with tables."""
-        doc = Document()
+        doc = new_document()
 
         # Header
         header_para = doc.add_paragraph()
@@ -658,12 +641,18 @@ class TestComplexDocuments:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "complex_02_invoice.docx")
-        assert path.exists()
+        save_document(doc, "complex_02_invoice.docx")
+
+        assert [c.text for c in info_table.columns[1].cells] == ["INV-2026-0001", "January 4, 2026"]
+        assert "456 Business Ave\nSuite 100\nNew York, NY" in [p.text for p in doc.paragraphs]
+        assert [c.text for c in items_table.rows[1].cells] == ["Consulting Services", "40 hours", "$4,000.00"]
+        assert [c.text for c in items_table.rows[2].cells] == ["Software License", "1", "$500.00"]
+        assert all(r.bold for r in get_paragraph_runs_info(items_table.cell(1, 0).paragraphs[0]))
+        assert all(r.italic for r in get_paragraph_runs_info(items_table.cell(2, 0).paragraphs[0]))
 
     def test_report_with_sections(self):
         """Test a report-style document with multiple sections."""
-        doc = Document()
+        doc = new_document()
 
         # Title
         title = doc.add_heading("{{report_title}}", level=0)
@@ -701,14 +690,36 @@ class TestComplexDocuments:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "complex_03_report.docx")
-        assert path.exists()
+        save_document(doc, "complex_03_report.docx")
+
+        paragraphs = get_styled_paragraphs(doc)
+        assert paragraphs[0] == ("Title", "Q4 2025 Analysis Report")
+        assert [text for style, text in paragraphs if style == "List Number"] == [
+            "Revenue increased by 15%",
+            "Customer satisfaction improved to 92%",
+            "New market entry was successful",
+        ]
+        assert [text for style, text in paragraphs if style == "List Bullet"] == [
+            "Expand into new markets",
+            "Invest in R&D",
+            "Focus on customer retention",
+        ]
+
+        summary = next(p for p in doc.paragraphs if p.text.startswith("This report"))
+        assert any(r.bold and r.text == "comprehensive analysis" for r in get_paragraph_runs_info(summary))
+        findings = [p for p in doc.paragraphs if p.style.name == "List Number"]
+        assert any(r.font_name == "Courier New" and r.text == "successful" for r in get_paragraph_runs_info(findings[2]))
+        markets = next(p for p in doc.paragraphs if p.text == "Expand into new markets")
+        assert has_hyperlink(markets)
 
 
 # =============================================================================
 # Edge Cases and Error Handling Tests
 # =============================================================================
 
+LONG_TEXT = "Lorem ipsum dolor sit amet. " * 100
+
+
 class TestEdgeCases:
     """Tests for edge cases and error handling."""
 
@@ -722,8 +733,9 @@ class TestEdgeCases:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "edge_01_underscore_names.docx")
-        assert path.exists()
+        save_document(doc, "edge_01_underscore_names.docx")
+
+        assert doc.paragraphs[0].text == "John Doe"
 
     def test_placeholder_with_numbers(self):
         """Test placeholder names with numbers."""
@@ -736,19 +748,20 @@ class TestEdgeCases:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "edge_02_numbered_names.docx")
-        assert path.exists()
+        save_document(doc, "edge_02_numbered_names.docx")
+
+        assert doc.paragraphs[0].text == "First Second Third"
 
     def test_very_long_replacement(self):
         """Test replacement with very long text."""
         doc = create_test_document_with_placeholder("{{content}}")
-        long_text = "Lorem ipsum dolor sit amet. " * 100
-        context = {"content": long_text}
+        context = {"content": LONG_TEXT}
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "edge_03_long_text.docx")
-        assert path.exists()
+        save_document(doc, "edge_03_long_text.docx")
+
+        assert doc.paragraphs[0].text == LONG_TEXT
 
     def test_consecutive_placeholders(self):
         """Test placeholders directly next to each other."""
@@ -761,8 +774,9 @@ class TestEdgeCases:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "edge_04_consecutive.docx")
-        assert path.exists()
+        save_document(doc, "edge_04_consecutive.docx")
+
+        assert doc.paragraphs[0].text == "ABC"
 
     def test_empty_document_with_placeholder(self):
         """Test document with only a placeholder."""
@@ -771,20 +785,23 @@ class TestEdgeCases:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "edge_05_empty_doc.docx")
-        assert path.exists()
+        save_document(doc, "edge_05_empty_doc.docx")
+
+        assert doc.paragraphs[0].text == "This is the entire document content."
 
     def test_placeholder_not_in_runs(self):
         """Test behavior when paragraph has no runs (edge case)."""
-        doc = Document()
+        doc = new_document()
         para = doc.add_paragraph()
         # Paragraph exists but has no runs - should not crash
 
         context = {"test": "value"}
         _replace_placeholders_in_paragraph(para, context)
 
-        path = save_document(doc, "edge_06_no_runs.docx")
-        assert path.exists()
+        save_document(doc, "edge_06_no_runs.docx")
+
+        assert para.text == ""
+        assert para.runs == []
 
     def test_triple_brace_placeholder(self):
         """Test triple-brace mustache syntax {{{name}}}."""
@@ -793,8 +810,11 @@ class TestEdgeCases:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "edge_07_triple_brace.docx")
-        assert path.exists()
+        save_document(doc, "edge_07_triple_brace.docx")
+
+        runs = get_paragraph_runs_info(doc.paragraphs[0])
+        assert doc.paragraphs[0].text == "Content with formatting"
+        assert any(r.bold and r.text == "formatting" for r in runs)
 
 
 # =============================================================================
@@ -837,7 +857,7 @@ templates:
         """Test that YAML config is loaded correctly."""
         import yaml
         content = sample_yaml_config.read_text(encoding="utf-8")
-        config = yaml.safe_load(content)
+        config = yaml.load(content, Loader=YAML_LOADER)
 
         assert "templates" in config
         assert len(config["templates"]) == 1
@@ -846,8 +866,6 @@ templates:
     def test_find_template_in_custom_dir(self):
         """Test finding templates in custom_templates directory."""
         # This test depends on the actual letter_template.docx existing
-        from docx_tools.dynamic_docx_tools import find_docx_template_by_name
-
         result = find_docx_template_by_name("letter_template.docx")
         # Should find the template we created earlier
         if result:
@@ -897,7 +915,7 @@ Some text here
 
     def test_simple_unordered_list(self):
         """Test placeholder with simple unordered list."""
-        doc = Document()
+        doc = new_document()
         para = doc.add_paragraph()
         para.add_run("{{items}}")
 
@@ -907,11 +925,10 @@ Some text here
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "list_01_simple_unordered.docx")
-        assert path.exists()
+        buf = save_document(doc, "list_01_simple_unordered.docx")
 
         # Verify list items were created as separate paragraphs
-        doc2 = Document(path)
+        doc2 = Document(buf)
         # Should have list paragraphs
         list_paragraphs = [p for p in doc2.paragraphs if p.text.strip() and
                           ('Apple' in p.text or 'Banana' in p.text or 'Orange' in p.text)]
@@ -919,7 +936,7 @@ Some text here
 
     def test_simple_ordered_list(self):
         """Test placeholder with simple ordered list."""
-        doc = Document()
+        doc = new_document()
         para = doc.add_paragraph()
         para.add_run("{{steps}}")
 
@@ -929,18 +946,17 @@ Some text here
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "list_02_simple_ordered.docx")
-        assert path.exists()
+        buf = save_document(doc, "list_02_simple_ordered.docx")
 
         # Verify list items were created
-        doc2 = Document(path)
+        doc2 = Document(buf)
         list_paragraphs = [p for p in doc2.paragraphs if p.text.strip() and
                           ('First step' in p.text or 'Second step' in p.text or 'Third step' in p.text)]
         assert len(list_paragraphs) >= 3
 
     def test_unordered_list_with_formatting(self):
         """Test unordered list items with markdown formatting."""
-        doc = Document()
+        doc = new_document()
         para = doc.add_paragraph()
         para.add_run("{{items}}")
 
@@ -951,12 +967,18 @@ Some text here
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "list_03_unordered_formatted.docx")
-        assert path.exists()
+        save_document(doc, "list_03_unordered_formatted.docx")
+
+        items = [p for p in doc.paragraphs if p.style.name == "List Bullet"]
+        assert [p.text for p in items] == ["Bold item", "Italic item", "Item with code", "Item with link"]
+        assert all(r.bold for r in get_paragraph_runs_info(items[0]))
+        assert all(r.italic for r in get_paragraph_runs_info(items[1]))
+        assert any(r.font_name == "Courier New" and r.text == "code" for r in get_paragraph_runs_info(items[2]))
+        assert has_hyperlink(items[3])
 
     def test_ordered_list_with_formatting(self):
         """Test ordered list items with markdown formatting."""
-        doc = Document()
+        doc = new_document()
         para = doc.add_paragraph()
         para.add_run("{{steps}}")
 
@@ -966,12 +988,17 @@ Some text here
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "list_04_ordered_formatted.docx")
-        assert path.exists()
+        save_document(doc, "list_04_ordered_formatted.docx")
+
+        items = [p for p in doc.paragraphs if p.style.name == "List Number"]
+        assert [p.text for p in items] == ["Important first step", "Do something here", "Use function() to complete"]
+        assert all(r.bold for r in get_paragraph_runs_info(items[0]))
+        assert any(r.italic and r.text == "something" for r in get_paragraph_runs_info(items[1]))
+        assert any(r.font_name == "Courier New" and r.text == "function()" for r in get_paragraph_runs_info(items[2]))
 
     def test_list_with_preceding_text(self):
         """Test list with text before it."""
-        doc = Document()
+        doc = new_document()
         para = doc.add_paragraph()
         para.add_run("{{content}}")
 
@@ -982,12 +1009,18 @@ Some text here
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "list_05_with_preceding_text.docx")
-        assert path.exists()
+        save_document(doc, "list_05_with_preceding_text.docx")
+
+        assert get_styled_paragraphs(doc) == [
+            ("Normal", "Here are the key points:"),
+            ("List Bullet", "First point"),
+            ("List Bullet", "Second point"),
+            ("List Bullet", "Third point"),
+        ]
 
     def test_list_with_following_text(self):
         """Test list with text after it."""
-        doc = Document()
+        doc = new_document()
         para = doc.add_paragraph()
         para.add_run("{{content}}")
 
@@ -999,12 +1032,18 @@ That's all for now."""}
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "list_06_with_following_text.docx")
-        assert path.exists()
+        save_document(doc, "list_06_with_following_text.docx")
+
+        assert get_styled_paragraphs(doc) == [
+            ("List Bullet", "First item"),
+            ("List Bullet", "Second item"),
+            ("List Bullet", "Third item"),
+            ("Normal", "That's all for now."),
+        ]
 
     def test_mixed_list_types(self):
         """Test document with both ordered and unordered lists."""
-        doc = Document()
+        doc = new_document()
         para = doc.add_paragraph()
         para.add_run("{{content}}")
 
@@ -1020,12 +1059,22 @@ Steps to follow:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "list_07_mixed_types.docx")
-        assert path.exists()
+        save_document(doc, "list_07_mixed_types.docx")
+
+        assert get_styled_paragraphs(doc) == [
+            ("Normal", "Shopping list:"),
+            ("List Bullet", "Apples"),
+            ("List Bullet", "Bananas"),
+            ("List Bullet", "Oranges"),
+            ("Normal", "Steps to follow:"),
+            ("List Number", "Go to store"),
+            ("List Number", "Buy items"),
+            ("List Number", "Return home"),
+        ]
 
     def test_nested_unordered_list(self):
         """Test nested unordered list items."""
-        doc = Document()
+        doc = new_document()
         para = doc.add_paragraph()
         para.add_run("{{items}}")
 
@@ -1037,12 +1086,19 @@ Steps to follow:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "list_08_nested_unordered.docx")
-        assert path.exists()
+        save_document(doc, "list_08_nested_unordered.docx")
+
+        assert get_styled_paragraphs(doc) == [
+            ("List Bullet", "Main item 1"),
+            ("List Bullet 2", "Sub item 1.1"),
+            ("List Bullet 2", "Sub item 1.2"),
+            ("List Bullet", "Main item 2"),
+            ("List Bullet 2", "Sub item 2.1"),
+        ]
 
     def test_nested_ordered_list(self):
         """Test nested ordered list items."""
-        doc = Document()
+        doc = new_document()
         para = doc.add_paragraph()
         para.add_run("{{steps}}")
 
@@ -1054,12 +1110,19 @@ Steps to follow:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "list_09_nested_ordered.docx")
-        assert path.exists()
+        save_document(doc, "list_09_nested_ordered.docx")
+
+        assert get_styled_paragraphs(doc) == [
+            ("List Number", "First main step"),
+            ("List Number 2", "Sub-step 1.1"),
+            ("List Number 2", "Sub-step 1.2"),
+            ("List Number", "Second main step"),
+            ("List Number 2", "Sub-step 2.1"),
+        ]
 
     def test_list_placeholder_in_context(self):
         """Test list placeholder when there is text before and after the placeholder."""
-        doc = Document()
+        doc = new_document()
         para = doc.add_paragraph()
         para.add_run("Before: {{list}} After the list.")
 
@@ -1069,18 +1132,17 @@ Steps to follow:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "list_10_with_context.docx")
-        assert path.exists()
+        buf = save_document(doc, "list_10_with_context.docx")
 
         # Verify "Before:" text is present
-        doc2 = Document(path)
+        doc2 = Document(buf)
         full_text = " ".join(p.text for p in doc2.paragraphs)
         assert "Before:" in full_text
         assert "After the list." in full_text
 
     def test_asterisk_list_marker(self):
         """Test unordered list with asterisk marker (*)."""
-        doc = Document()
+        doc = new_document()
         para = doc.add_paragraph()
         para.add_run("{{items}}")
 
@@ -1090,12 +1152,17 @@ Steps to follow:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "list_11_asterisk_marker.docx")
-        assert path.exists()
+        save_document(doc, "list_11_asterisk_marker.docx")
+
+        assert get_styled_paragraphs(doc) == [
+            ("List Bullet", "Apple"),
+            ("List Bullet", "Banana"),
+            ("List Bullet", "Orange"),
+        ]
 
     def test_plus_list_marker(self):
         """Test unordered list with plus marker (+)."""
-        doc = Document()
+        doc = new_document()
         para = doc.add_paragraph()
         para.add_run("{{items}}")
 
@@ -1105,8 +1172,13 @@ Steps to follow:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "list_12_plus_marker.docx")
-        assert path.exists()
+        save_document(doc, "list_12_plus_marker.docx")
+
+        assert get_styled_paragraphs(doc) == [
+            ("List Bullet", "Apple"),
+            ("List Bullet", "Banana"),
+            ("List Bullet", "Orange"),
+        ]
 
     def test_list_in_table_cell_fallback(self):
         """Test that lists in table cells fallback to inline text.
@@ -1114,7 +1186,7 @@ Steps to follow:
         Lists are not supported in table cells, so the value should be
         inserted as plain formatted text.
         """
-        doc = Document()
+        doc = new_document()
         table = doc.add_table(rows=2, cols=1)
         table.style = 'Table Grid'
         table.cell(0, 0).text = "Items"
@@ -1127,12 +1199,15 @@ Steps to follow:
         # This should work without error, lists just won't be formatted as lists
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "list_13_table_fallback.docx")
-        assert path.exists()
+        save_document(doc, "list_13_table_fallback.docx")
+
+        # The markdown list markers stay in the cell as plain text
+        assert len(table.cell(1, 0).paragraphs) == 1
+        assert table.cell(1, 0).text == context["items"]
 
     def test_complex_document_with_lists(self):
         """Test a complex document with multiple lists and formatting."""
-        doc = Document()
+        doc = new_document()
 
         # Add heading
         doc.add_heading("Project Overview", level=1)
@@ -1158,12 +1233,28 @@ Steps to follow:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "list_14_complex_document.docx")
-        assert path.exists()
+        save_document(doc, "list_14_complex_document.docx")
+
+        paragraphs = get_styled_paragraphs(doc)
+        assert paragraphs[0] == ("Heading 1", "Project Overview")
+        assert [text for style, text in paragraphs if style == "List Bullet"] == [
+            "Performance - Optimized for speed",
+            "Security - Enterprise-grade protection",
+            "Scalability - Grows with your needs",
+        ]
+        assert [text for style, text in paragraphs if style == "List Number"] == [
+            "Install the package",
+            "Configure settings",
+            "Run the setup wizard",
+            "Deploy to production",
+        ]
+
+        features = [p for p in doc.paragraphs if p.style.name == "List Bullet"]
+        assert [get_paragraph_runs_info(p)[0].bold for p in features] == [True, True, True]
 
     def test_list_with_empty_lines(self):
         """Test list with empty lines between items."""
-        doc = Document()
+        doc = new_document()
         para = doc.add_paragraph()
         para.add_run("{{items}}")
 
@@ -1175,8 +1266,13 @@ Steps to follow:
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "list_15_with_empty_lines.docx")
-        assert path.exists()
+        save_document(doc, "list_15_with_empty_lines.docx")
+
+        assert get_styled_paragraphs(doc) == [
+            ("List Bullet", "First item"),
+            ("List Bullet", "Second item"),
+            ("List Bullet", "Third item"),
+        ]
 
 
 # =============================================================================
@@ -1188,7 +1284,7 @@ class TestHeadingsInPlaceholders:
 
     def test_simple_heading(self):
         """Test placeholder with a simple heading."""
-        doc = Document()
+        doc = new_document()
         para = doc.add_paragraph()
         para.add_run("{{content}}")
 
@@ -1197,18 +1293,17 @@ This is some body text."""}
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "heading_01_simple.docx")
-        assert path.exists()
+        buf = save_document(doc, "heading_01_simple.docx")
 
         # Verify heading was created
-        doc2 = Document(str(path))
+        doc2 = Document(buf)
         # Check that heading style was applied
         heading_paragraphs = [p for p in doc2.paragraphs if p.style.name.startswith('Heading')]
         assert len(heading_paragraphs) >= 1
 
     def test_multiple_heading_levels(self):
         """Test placeholder with multiple heading levels."""
-        doc = Document()
+        doc = new_document()
         para = doc.add_paragraph()
         para.add_run("{{content}}")
 
@@ -1223,12 +1318,20 @@ Even more specific."""}
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "heading_02_multiple_levels.docx")
-        assert path.exists()
+        save_document(doc, "heading_02_multiple_levels.docx")
+
+        assert get_styled_paragraphs(doc) == [
+            ("Heading 1", "Heading 1"),
+            ("Normal", "Introduction text."),
+            ("Heading 2", "Heading 2"),
+            ("Normal", "More details here."),
+            ("Heading 3", "Heading 3"),
+            ("Normal", "Even more specific."),
+        ]
 
     def test_heading_with_formatting(self):
         """Test heading with inline markdown formatting."""
-        doc = Document()
+        doc = new_document()
         para = doc.add_paragraph()
         para.add_run("{{content}}")
 
@@ -1237,12 +1340,18 @@ Regular paragraph text."""}
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "heading_03_with_formatting.docx")
-        assert path.exists()
+        save_document(doc, "heading_03_with_formatting.docx")
+
+        heading = next(p for p in doc.paragraphs if p.style.name == "Heading 1")
+        runs = get_paragraph_runs_info(heading)
+        assert heading.text == "Bold and italic heading"
+        assert any(r.bold and r.text == "Bold" for r in runs)
+        assert any(r.italic and r.text == "italic" for r in runs)
+        assert ("Normal", "Regular paragraph text.") in get_styled_paragraphs(doc)
 
     def test_heading_with_lists(self):
         """Test heading followed by lists."""
-        doc = Document()
+        doc = new_document()
         para = doc.add_paragraph()
         para.add_run("{{content}}")
 
@@ -1258,12 +1367,22 @@ Regular paragraph text."""}
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "heading_04_with_lists.docx")
-        assert path.exists()
+        save_document(doc, "heading_04_with_lists.docx")
+
+        assert get_styled_paragraphs(doc) == [
+            ("Heading 1", "Shopping List"),
+            ("List Bullet", "Apples"),
+            ("List Bullet", "Bananas"),
+            ("List Bullet", "Oranges"),
+            ("Heading 2", "Steps"),
+            ("List Number", "Go to store"),
+            ("List Number", "Buy items"),
+            ("List Number", "Return home"),
+        ]
 
     def test_h1_to_h6_headings(self):
         """Test all heading levels from H1 to H6."""
-        doc = Document()
+        doc = new_document()
         para = doc.add_paragraph()
         para.add_run("{{content}}")
 
@@ -1276,12 +1395,13 @@ Regular paragraph text."""}
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "heading_05_all_levels.docx")
-        assert path.exists()
+        save_document(doc, "heading_05_all_levels.docx")
+
+        assert get_styled_paragraphs(doc) == [(f"Heading {level}", f"Heading {level}") for level in range(1, 7)]
 
     def test_heading_in_complex_document(self):
         """Test headings in a complex document structure."""
-        doc = Document()
+        doc = new_document()
         doc.add_heading("Document Title", level=0)
         para = doc.add_paragraph()
         para.add_run("{{sections}}")
@@ -1303,8 +1423,22 @@ Final thoughts here."""}
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "heading_06_complex_document.docx")
-        assert path.exists()
+        save_document(doc, "heading_06_complex_document.docx")
+
+        assert get_styled_paragraphs(doc) == [
+            ("Title", "Document Title"),
+            ("Heading 1", "Introduction"),
+            ("Normal", "This document covers important topics."),
+            ("Heading 2", "Background"),
+            ("Normal", "Some background information."),
+            ("Heading 2", "Main Points"),
+            ("List Bullet", "Point one"),
+            ("List Bullet", "Point two"),
+            ("List Bullet", "Point three"),
+            ("Heading 2", "Conclusion"),
+            ("Normal", "Final thoughts here."),
+            ("Normal", "Footer text"),
+        ]
 
 
 # =============================================================================
@@ -1316,41 +1450,45 @@ class TestPerformance:
 
     def test_many_placeholders(self):
         """Test document with many placeholders."""
-        doc = Document()
+        doc = new_document()
 
         # Create 50 paragraphs with placeholders
         for i in range(50):
             doc.add_paragraph().add_run(f"Item {{{{item_{i}}}}}: {{{{value_{i}}}}}")
 
-        context = {}
-        for i in range(50):
-            context[f"item_{i}"] = f"Item {i}"
-            context[f"value_{i}"] = f"Value **{i}**"
+        context = (
+            {f"item_{i}": f"Item {i}" for i in range(50)}
+            | {f"value_{i}": f"Value **{i}**" for i in range(50)}
+        )
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "perf_01_many_placeholders.docx")
-        assert path.exists()
+        save_document(doc, "perf_01_many_placeholders.docx")
+
+        assert [p.text for p in doc.paragraphs] == [f"Item Item {i}: Value {i}" for i in range(50)]
+        assert all(
+            any(r.bold and r.text == str(i) for r in get_paragraph_runs_info(p))
+            for i, p in enumerate(doc.paragraphs)
+        )
 
     def test_large_table_with_placeholders(self):
         """Test large table with placeholders in each cell."""
-        doc = Document()
+        doc = new_document()
 
         rows, cols = 10, 5
         table = doc.add_table(rows=rows, cols=cols)
         table.style = 'Table Grid'
 
-        context = {}
-        for i in range(rows):
-            for j in range(cols):
-                placeholder = f"{{{{cell_{i}_{j}}}}}"
-                table.cell(i, j).text = placeholder
-                context[f"cell_{i}_{j}"] = f"R{i}C{j}"
+        context = {f"cell_{i}_{j}": f"R{i}C{j}" for i in range(rows) for j in range(cols)}
+        cells = (cell for row in table.rows for cell in row.cells)
+        for cell, key in zip(cells, context):
+            cell.text = f"{{{{{key}}}}}"
 
         _replace_placeholders_in_document(doc, context)
 
-        path = save_document(doc, "perf_02_large_table.docx")
-        assert path.exists()
+        save_document(doc, "perf_02_large_table.docx")
+
+        assert [cell.text for row in table.rows for cell in row.cells] == list(context.values())
 
 
 # =============================================================================
@@ -1362,8 +1500,6 @@ class TestIntegration:
 
     def test_full_letter_workflow(self):
         """Test complete workflow of loading template and generating document."""
-        from docx_tools.dynamic_docx_tools import find_docx_template_by_name
-
         # Find the letter template
         template_path = find_docx_template_by_name("letter_template.docx")
         if not template_path:
@@ -1392,15 +1528,28 @@ class TestIntegration:
         _replace_placeholders_in_document(doc, context)
 
         # Save the result
-        path = save_document(doc, "integration_01_letter.docx")
-        assert path.exists()
+        buf = save_document(doc, "integration_01_letter.docx")
 
         # Verify content
-        doc2 = Document(path)
-        full_text = "\n".join([p.text for p in doc2.paragraphs])
+        doc2 = Document(buf)
+        full_text = "\n".join(p.text for p in doc2.paragraphs)
         assert "Pavel Novotný" in full_text
         assert "spolupráce" in full_text
 
+    def test_render_docx_template(self):
+        """Test rendering a template straight to an in-memory .docx."""
+        template_path = find_docx_template_by_name("letter_template.docx")
+        if not template_path:
+            pytest.skip("letter_template.docx not found in template directories")
+
+        buffer = render_docx_template(template_path, {"recipient_name": "Jan Novák"})
+
+        assert buffer.tell() == 0
+        doc = Document(buffer)
+        full_text = "\n".join(p.text for p in doc.paragraphs)
+        assert "Jan Novák" in full_text
+        assert "{{recipient_name}}" not in full_text
+
 
 # =============================================================================
 # Comprehensive Visual Inspection Test
@@ -1412,7 +1561,8 @@ class TestVisualInspection:
     This test creates a document with ALL supported placeholder and markdown features
     for easy visual verification in Word/LibreOffice.
 
-    Output: tests/output/docx/VISUAL_INSPECTION_templates.docx
+    Output (with --save-outputs): tests/output/docx/VISUAL_INSPECTION_templates.docx,
+    or tests/output/docx/<worker>/ when running under pytest-xdist.
     """
 
     def test_comprehensive_template_visual_document(self):
@@ -1427,7 +1577,7 @@ class TestVisualInspection:
         - Headers and footers
         - Unicode and special characters
         """
-        doc = Document()
+        doc = new_document()
 
         # === HEADER ===
         section = doc.sections[0]
@@ -1633,12 +1783,11 @@ Acme Corporation
         _replace_placeholders_in_document(doc, context)
 
         # Save the document
-        path = save_document(doc, "VISUAL_INSPECTION_templates.docx")
-        assert path.exists()
+        buf = save_document(doc, "VISUAL_INSPECTION_templates.docx")
 
         # Verify content
-        doc2 = Document(path)
-        full_text = "\n".join([p.text for p in doc2.paragraphs])
+        doc2 = Document(buf)
+        full_text = "\n".join(p.text for p in doc2.paragraphs)
 
         # Basic content checks
         assert "Comprehensive Template Visual Inspection" in full_text
@@ -5,27 +5,15 @@ Output files are saved to tests/output/pptx/ directory.
 """
 
 import os
-import sys
 from pathlib import Path
 
-# Add project root to path for imports
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
 import pytest
 from pptx_tools.slide_builder import PowerpointPresentation
 
-# Output directory for test files
+# Output directory for test files (created once per session by conftest)
 OUTPUT_DIR = Path(__file__).parent / "output" / "pptx"
 
 
-@pytest.fixture(scope="module", autouse=True)
-def setup_output_dir():
-    """Create output directory if it doesn't exist."""
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    yield
-
-
 def save_presentation(pres: PowerpointPresentation, filename: str) -> Path:
     """Save presentation to output directory and return path."""
     output_path = OUTPUT_DIR / filename
@@ -0,0 +1,154 @@
+"""Tests for upload_tools (LOCAL saves, content types and strategy dispatch).
+
+Cloud backends are not contacted; dispatch tests replace the backend
+functions with recorders.
+"""
+
+import io
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from config import StorageStrategy
+from upload_tools import main as upload_main
+from upload_tools.backends import local
+from upload_tools.backends.local import upload_to_local_folder
+from upload_tools.utils import get_content_type
+
+PAYLOAD = b"PK\x03\x04" + bytes(range(256)) * 64
+
+
+@pytest.fixture
+def upload_dir(tmp_path, monkeypatch):
+    """Run the LOCAL strategy inside tmp_path and return its output folder."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path / "output"
+
+
+# =============================================================================
+# LOCAL strategy
+# =============================================================================
+
+class TestLocalUpload:
+    """Tests for upload_to_local_folder with different source streams."""
+
+    def test_bytesio_source(self, upload_dir):
+        """In-memory buffers have no descriptor and use the buffered copy."""
+        result = upload_to_local_folder(io.BytesIO(PAYLOAD), "doc.docx")
+
+        assert result == f"Document saved to {upload_dir / 'doc.docx'}"
+        assert (upload_dir / "doc.docx").read_bytes() == PAYLOAD
+
+    def test_real_file_source(self, upload_dir):
+        """Regular files are copied with os.sendfile from the start of the file."""
+        with tempfile.TemporaryFile() as src:
+            src.write(PAYLOAD)
+            upload_to_local_folder(src, "doc.pptx")
+
+        assert (upload_dir / "doc.pptx").read_bytes() == PAYLOAD
+
+    def test_pipe_source(self, upload_dir):
+        """Pipes are not regular files and fall back to the buffered copy."""
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, PAYLOAD[:4096])
+        os.close(write_fd)
+        with os.fdopen(read_fd, "rb") as src:
+            result = upload_to_local_folder(src, "doc.xlsx")
+
+        assert result.startswith("Document saved to ")
+        assert (upload_dir / "doc.xlsx").read_bytes() == PAYLOAD[:4096]
+
+    def test_fadvise_failure_is_ignored(self, upload_dir, monkeypatch):
+        """A rejected posix_fadvise hint does not fail the save."""
+        if not hasattr(os, "posix_fadvise"):
+            pytest.skip("os.posix_fadvise is not available")
+
+        def reject(*args):
+            raise OSError(22, "Invalid argument")
+
+        monkeypatch.setattr(local.os, "posix_fadvise", reject)
+        with tempfile.TemporaryFile() as src:
+            src.write(PAYLOAD)
+            upload_to_local_folder(src, "doc.docx")
+
+        assert (upload_dir / "doc.docx").read_bytes() == PAYLOAD
+
+
+# =============================================================================
+# Content types
+# =============================================================================
+
+@pytest.mark.parametrize("file_name, expected", [
+    ("deck.pptx", "application/vnd.openxmlformats-officedocument.presentationml.presentation"),
+    ("report.docx", "application/vnd.openxmlformats-officedocument.wordprocessingml.document"),
+    ("sheet.xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    ("mail.eml", "application/octet-stream"),
+    ("data.xml", "application/xml"),
+    ("REPORT.DocX", "application/vnd.openxmlformats-officedocument.wordprocessingml.document"),
+    ("notes_about_pptx.docx", "application/vnd.openxmlformats-officedocument.wordprocessingml.document"),
+])
+def test_get_content_type(file_name, expected):
+    """Content type comes from the extension only, case-insensitively."""
+    assert get_content_type(file_name) == expected
+
+
+@pytest.mark.parametrize("file_name", ["archive.zip", "docx", "no_suffix", "report.docx.bak"])
+def test_get_content_type_unknown(file_name):
+    """Unknown or missing extensions are rejected."""
+    with pytest.raises(ValueError, match="Unknown file type"):
+        get_content_type(file_name)
+
+
+# =============================================================================
+# Strategy dispatch
+# =============================================================================
+
+# Backend function, StorageSettings attribute and the keyword it is bound to
+STRATEGY_BACKENDS = {
+    StorageStrategy.LOCAL: ("upload_to_local_folder", None, None),
+    StorageStrategy.S3: ("upload_to_s3", "s3", "s3cfg"),
+    StorageStrategy.GCS: ("upload_to_gcs", "gcs", "gcscfg"),
+    StorageStrategy.AZURE: ("upload_to_azure", "azure", "azcfg"),
+    StorageStrategy.MINIO: ("upload_to_minio", "minio", "minicfg"),
+}
+
+
+@pytest.mark.parametrize("strategy", list(StorageStrategy))
+def test_strategy_dispatch(strategy, monkeypatch):
+    """Each strategy calls its own backend with that backend's config bound."""
+    backend_name, settings_attr, cfg_kwarg = STRATEGY_BACKENDS[strategy]
+    calls = []
+
+    def record(file_object, file_name, *args, **kwargs):
+        calls.append((file_object, file_name, kwargs))
+        return "uploaded"
+
+    monkeypatch.setattr(upload_main, backend_name, record)
+    monkeypatch.setattr(upload_main, "UPLOAD_STRATEGY", strategy)
+    monkeypatch.setattr(upload_main, "_UPLOAD_IMPL", upload_main._select_upload_impl())
+
+    buffer = io.BytesIO(b"data")
+    assert upload_main.upload_file(buffer, "docx") == "uploaded"
+
+    [(file_object, file_name, kwargs)] = calls
+    assert file_object is buffer
+    assert Path(file_name).suffix == ".docx"
+    if settings_attr is None:
+        assert kwargs == {}
+    else:
+        assert kwargs == {
+            cfg_kwarg: getattr(upload_main.cfg.storage, settings_attr),
+            "signed_url_expires_in": upload_main.SIGNED_URL_EXPIRES_IN,
+        }
+
+
+def test_unknown_strategy_dispatch(monkeypatch):
+    """An unknown strategy reports that nothing was uploaded."""
+    monkeypatch.setattr(upload_main, "UPLOAD_STRATEGY", "NONE")
+    monkeypatch.setattr(upload_main, "_UPLOAD_IMPL", upload_main._select_upload_impl())
+
+    assert upload_main.upload_file(io.BytesIO(b"data"), "docx") == (
+        "No upload strategy set, presentation cannot be created."
+    )
@@ -5,15 +5,9 @@ including valid XML, invalid XML, auto-declaration behavior, encoding handling,
 and security protection against malicious XML content.
 """
 
-import sys
-from pathlib import Path
 from unittest.mock import patch, MagicMock
 import io
 
-# Add project root to path for imports
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
 import pytest
 
 from xml_tools.base_xml_tool import (
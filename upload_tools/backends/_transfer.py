@@ -0,0 +1,22 @@
+# Multipart settings for large S3 and MinIO uploads: parts above the threshold are sent concurrently
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+MULTIPART_MAX_CONCURRENCY = 16
+
+# Shared multipart TransferConfig, built on first use so boto3 stays a lazy import
+_TRANSFER_CONFIG = None
+
+
+def get_transfer_config():
+    """Return the boto3 TransferConfig shared by S3 and MinIO uploads, creating it once."""
+    global _TRANSFER_CONFIG
+    if _TRANSFER_CONFIG is None:
+        from boto3.s3.transfer import TransferConfig  # type: ignore
+
+        _TRANSFER_CONFIG = TransferConfig(
+            multipart_threshold=MULTIPART_THRESHOLD,
+            multipart_chunksize=MULTIPART_CHUNK_SIZE,
+            max_concurrency=MULTIPART_MAX_CONCURRENCY,
+            use_threads=True,
+        )
+    return _TRANSFER_CONFIG
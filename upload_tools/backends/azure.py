@@ -1,9 +1,12 @@
 import logging
 from datetime import timedelta, datetime, timezone
-from ..utils import get_content_type
+from ..utils import get_content_type, rewind
 
 logger = logging.getLogger(__name__)
 
+# Parallel block uploads for blobs larger than the SDK's single-put limit
+AZURE_MAX_CONCURRENCY = 16
+
 
 def upload_to_azure(file_object, file_name: str, azcfg, signed_url_expires_in: int):
     """Upload a file to Azure Blob Storage and return a SAS URL valid for configured duration."""
@@ -38,15 +41,16 @@ def upload_to_azure(file_object, file_name: str, azcfg, signed_url_expires_in: i
 
         # Upload the blob
         blob_client = container_client.get_blob_client(file_name)
-        file_object.seek(0)
+        rewind(file_object)
         blob_client.upload_blob(
             file_object,
             overwrite=True,
-            content_settings=ContentSettings(content_type=content_type)
+            content_settings=ContentSettings(content_type=content_type),
+            max_concurrency=AZURE_MAX_CONCURRENCY,
         )
 
         # Generate a SAS token for read access
-        expiry_time = datetime.now(timezone.utc) + timedelta(seconds=signed_url_expires_in)
+        expiry_time = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(seconds=signed_url_expires_in)
         sas_token = generate_blob_sas(
             account_name=account_name,
             container_name=container_name,
@@ -1,9 +1,74 @@
 import logging
+import os
 from datetime import timedelta
-from ..utils import get_content_type
+from ..utils import get_content_type, rewind
 
 logger = logging.getLogger(__name__)
 
+# On-disk sources larger than this go through XML API multipart upload with concurrent
+# parts; the default JSON resumable upload has to send its chunks one after another.
+# In-memory documents always use the resumable upload: spooling them to a temporary
+# file just for the multipart helper would double the I/O for the largest objects.
+MULTIPART_THRESHOLD = 32 * 1024 * 1024
+MULTIPART_CHUNK_SIZE = 32 * 1024 * 1024
+MULTIPART_MAX_WORKERS = 8
+
+# GCS clients keyed by credentials file; building one parses the service account JSON
+_GCS_CLIENTS: dict[str, object] = {}
+
+# (credentials, service account email) keyed by credentials file, used to sign URLs locally
+_GCS_SIGNERS: dict[str, tuple] = {}
+
+
+def _get_gcs_client(gcscfg):
+    """Return a cached GCS client for the configured credentials, importing the SDK on first use."""
+    from google.cloud import storage  # type: ignore
+
+    client = _GCS_CLIENTS.get(gcscfg.credentials_path)
+    if client is None:
+        client = storage.Client.from_service_account_json(gcscfg.credentials_path)
+        _GCS_CLIENTS[gcscfg.credentials_path] = client
+        credentials = client._credentials
+        _GCS_SIGNERS[gcscfg.credentials_path] = (
+            credentials,
+            getattr(credentials, "service_account_email", None),
+        )
+    return client
+
+
+def _signed_url(blob, signed_url_expires_in: int, credentials, service_account_email) -> str:
+    """Return a v4 GET URL signed locally with the service account key (no IAM signBlob call)."""
+    return blob.generate_signed_url(
+        version="v4",
+        expiration=timedelta(seconds=signed_url_expires_in),
+        method="GET",
+        credentials=credentials,
+        service_account_email=service_account_email,
+        access_token=None,
+    )
+
+
+def _source_path(file_object) -> str | None:
+    """Return the on-disk path behind a file object, or None for in-memory streams."""
+    name = getattr(file_object, "name", None)
+    if isinstance(name, str) and os.path.isfile(name):
+        return name
+    return None
+
+
+def _upload_multipart(blob, path: str, content_type: str) -> None:
+    """Upload a large file with XML API multipart upload, sending parts concurrently."""
+    from google.cloud.storage import transfer_manager  # type: ignore
+
+    transfer_manager.upload_chunks_concurrently(
+        path,
+        blob,
+        content_type=content_type,
+        chunk_size=MULTIPART_CHUNK_SIZE,
+        worker_type=transfer_manager.THREAD,
+        max_workers=MULTIPART_MAX_WORKERS,
+    )
+
 
 def upload_to_gcs(file_object, file_name: str, gcscfg, signed_url_expires_in: int):
     """Upload a file to a GCS bucket and return a signed URL valid for configured duration."""
@@ -14,7 +79,6 @@ def upload_to_gcs(file_object, file_name: str, gcscfg, signed_url_expires_in: in
 
     # Lazy import to avoid requiring google-cloud-storage unless GCS strategy is used
     try:
-        from google.cloud import storage  # type: ignore
         from google.cloud.exceptions import GoogleCloudError  # type: ignore
     except Exception:
         logger.error("google-cloud-storage is not installed. Please add it to requirements and install.")
@@ -23,22 +87,26 @@ def upload_to_gcs(file_object, file_name: str, gcscfg, signed_url_expires_in: in
     content_type = get_content_type(file_name)
 
     try:
-        # Create a GCS client with credentials from the configured path
-        storage_client = storage.Client.from_service_account_json(gcscfg.credentials_path)
+        # GCS client with credentials from the configured path
+        storage_client = _get_gcs_client(gcscfg)
 
         bucket = storage_client.bucket(gcscfg.bucket)
         blob = bucket.blob(file_name)
 
         # Upload the file to GCS
-        file_object.seek(0)  # Reset file pointer to beginning
-        blob.upload_from_file(file_object, content_type=content_type)
+        rewind(file_object)  # Reset file pointer to beginning
+        path = _source_path(file_object)
+        if path is not None:
+            # Parts are read from the path, so buffered writes must reach the disk first
+            file_object.flush()
+        if path is not None and os.path.getsize(path) > MULTIPART_THRESHOLD:
+            _upload_multipart(blob, path, content_type)
+        else:
+            blob.upload_from_file(file_object, content_type=content_type)
 
         # Generate a signed URL valid for configured duration
-        url = blob.generate_signed_url(
-            version="v4",
-            expiration=timedelta(seconds=signed_url_expires_in),
-            method="GET"
-        )
+        credentials, service_account_email = _GCS_SIGNERS[gcscfg.credentials_path]
+        url = _signed_url(blob, signed_url_expires_in, credentials, service_account_email)
 
         return f"Link to created document to be shared with user in markdown format: {url} . Link is valid for {signed_url_expires_in} seconds."
 
@@ -1,8 +1,61 @@
 import os
+import shutil
+import stat
 import logging
+from ..utils import rewind
 
 logger = logging.getLogger(__name__)
 
+# Chunk size used when streaming documents to disk
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def _sendfile_to_path(file_object, save_path: str) -> bool:
+    """Copy a real on-disk file to save_path in-kernel using os.sendfile.
+
+    Returns False when the source has no usable file descriptor (e.g., BytesIO)
+    or sendfile is not supported, so the caller can fall back to a buffered copy.
+    """
+    try:
+        src_fd = file_object.fileno()
+    except (OSError, AttributeError):
+        return False
+    if not hasattr(os, "sendfile"):
+        return False
+
+    # Make sure buffered writes to the source are visible through the descriptor
+    flush = getattr(file_object, "flush", None)
+    if flush:
+        flush()
+
+    st = os.fstat(src_fd)
+    if not stat.S_ISREG(st.st_mode):
+        # Pipes and sockets report no size; copy them through the buffered path
+        return False
+    size = st.st_size
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            # Only a hint; some filesystems and descriptors reject it
+            pass
+
+    dst_fd = os.open(save_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+    except OSError:
+        # Filesystem does not support sendfile; let the caller rewrite the file
+        logger.debug("os.sendfile failed for %s, falling back to buffered copy", save_path)
+        return False
+    finally:
+        os.close(dst_fd)
+    return True
+
 
 def upload_to_local_folder(file_object, file_name: str):
     """
@@ -17,9 +70,10 @@ def upload_to_local_folder(file_object, file_name: str):
     save_path = os.path.join(save_dir, file_name)
 
     try:
-        file_object.seek(0)
-        with open(save_path, 'wb') as f:
-            f.write(file_object.read())
+        rewind(file_object)
+        if not _sendfile_to_path(file_object, save_path):
+            with open(save_path, 'wb') as f:
+                shutil.copyfileobj(file_object, f, length=COPY_CHUNK_SIZE)
 
         logger.info("Saved file to %s", save_path)
         return f"Document saved to {save_path}"
@@ -1,9 +1,41 @@
 import logging
 
-from ..utils import get_content_type
+from ..utils import get_content_type, rewind
+from ._transfer import get_transfer_config
 
 logger = logging.getLogger(__name__)
 
+# boto3 clients are thread-safe and expensive to build; reuse one per endpoint/credential set
+_MINIO_CLIENTS: dict[tuple, object] = {}
+
+
+def _get_minio_client(minicfg):
+    """Return a cached S3 client for the MinIO settings, importing boto3 on first use."""
+    import boto3  # type: ignore
+    from botocore.config import Config as BotoConfig  # type: ignore
+
+    key = (
+        minicfg.endpoint, minicfg.access_key, minicfg.secret_key,
+        minicfg.region, minicfg.verify_ssl, minicfg.path_style,
+    )
+    client = _MINIO_CLIENTS.get(key)
+    if client is None:
+        addressing_style = "path" if minicfg.path_style else "auto"
+        endpoint_is_https = minicfg.endpoint.lower().startswith("https")
+        boto_cfg = BotoConfig(signature_version="s3v4", s3={"addressing_style": addressing_style})
+        client = boto3.client(
+            "s3",
+            aws_access_key_id=minicfg.access_key,
+            aws_secret_access_key=minicfg.secret_key,
+            region_name=minicfg.region,
+            endpoint_url=minicfg.endpoint,
+            use_ssl=endpoint_is_https,
+            verify=minicfg.verify_ssl if endpoint_is_https else False,
+            config=boto_cfg,
+        )
+        _MINIO_CLIENTS[key] = client
+    return client
+
 
 def upload_to_minio(file_object, file_name: str, minicfg, signed_url_expires_in: int):
     """Upload a file to a private MinIO bucket and generate a presigned URL."""
@@ -13,8 +45,7 @@ def upload_to_minio(file_object, file_name: str, minicfg, signed_url_expires_in:
         return None
 
     try:
-        import boto3  # type: ignore
-        from botocore.config import Config as BotoConfig  # type: ignore
+        import boto3  # type: ignore  # noqa: F401
         from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError  # type: ignore
     except ImportError:
         logger.error("boto3/botocore are required for MinIO uploads")
@@ -23,23 +54,13 @@ def upload_to_minio(file_object, file_name: str, minicfg, signed_url_expires_in:
     content_type = get_content_type(file_name)
 
     try:
-        addressing_style = "path" if minicfg.path_style else "auto"
-        endpoint_is_https = minicfg.endpoint.lower().startswith("https")
-        boto_cfg = BotoConfig(signature_version="s3v4", s3={"addressing_style": addressing_style})
-        s3_client = boto3.client(
-            "s3",
-            aws_access_key_id=minicfg.access_key,
-            aws_secret_access_key=minicfg.secret_key,
-            region_name=minicfg.region,
-            endpoint_url=minicfg.endpoint,
-            use_ssl=endpoint_is_https,
-            verify=minicfg.verify_ssl if endpoint_is_https else False,
-            config=boto_cfg,
-        )
+        s3_client = _get_minio_client(minicfg)
 
-        file_object.seek(0)
+        rewind(file_object)
         extra_args = {"ContentType": content_type}
-        s3_client.upload_fileobj(file_object, minicfg.bucket, file_name, ExtraArgs=extra_args)
+        s3_client.upload_fileobj(
+            file_object, minicfg.bucket, file_name, ExtraArgs=extra_args, Config=get_transfer_config()
+        )
 
         url = s3_client.generate_presigned_url(
             "get_object",
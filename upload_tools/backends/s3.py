@@ -1,8 +1,30 @@
 import logging
-from ..utils import get_content_type
+from ..utils import get_content_type, rewind
+from ._transfer import get_transfer_config
 
 logger = logging.getLogger(__name__)
 
+# boto3 clients are thread-safe and expensive to build; reuse one per credential set
+_S3_CLIENTS: dict[tuple[str, str, str], object] = {}
+
+
+def _get_s3_client(s3cfg):
+    """Return a cached S3 client for the given settings, importing boto3 on first use."""
+    import boto3  # type: ignore
+
+    key = (s3cfg.region, s3cfg.access_key, s3cfg.secret_key)
+    client = _S3_CLIENTS.get(key)
+    if client is None:
+        client = boto3.client(
+            's3',
+            region_name=s3cfg.region,
+            aws_access_key_id=s3cfg.access_key,
+            aws_secret_access_key=s3cfg.secret_key,
+            endpoint_url=f'https://s3.{s3cfg.region}.amazonaws.com'
+        )
+        _S3_CLIENTS[key] = client
+    return client
+
 
 def upload_to_s3(file_object, file_name: str, s3cfg, signed_url_expires_in: int):
     if not s3cfg:
@@ -11,7 +33,7 @@ def upload_to_s3(file_object, file_name: str, s3cfg, signed_url_expires_in: int)
 
     # Lazy import to avoid requiring boto3 unless S3 strategy is used
     try:
-        import boto3  # type: ignore
+        import boto3  # type: ignore  # noqa: F401
         from botocore.exceptions import NoCredentialsError, ClientError  # type: ignore
     except Exception as e:
         logger.error("boto3/botocore are not installed. Please add them to requirements and install.")
@@ -20,18 +42,14 @@ def upload_to_s3(file_object, file_name: str, s3cfg, signed_url_expires_in: int)
     content_type = get_content_type(file_name)
 
     try:
-        # Create an S3 client
-        s3_client = boto3.client(
-            's3',
-            region_name=s3cfg.region,
-            aws_access_key_id=s3cfg.access_key,
-            aws_secret_access_key=s3cfg.secret_key,
-            endpoint_url=f'https://s3.{s3cfg.region}.amazonaws.com'
-        )
+        s3_client = _get_s3_client(s3cfg)
 
         # Upload the file to S3
-        file_object.seek(0)
-        s3_client.upload_fileobj(Fileobj=file_object, Bucket=s3cfg.bucket, Key=file_name, ExtraArgs={'ContentType': content_type})
+        rewind(file_object)
+        s3_client.upload_fileobj(
+            Fileobj=file_object, Bucket=s3cfg.bucket, Key=file_name,
+            ExtraArgs={'ContentType': content_type}, Config=get_transfer_config()
+        )
 
         # Generate a pre-signed URL valid for configured duration
         url = s3_client.generate_presigned_url(
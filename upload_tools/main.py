@@ -1,5 +1,6 @@
 import logging
-from config import get_config
+from functools import partial
+from config import get_config, StorageStrategy
 from .utils import generate_unique_object_name
 from .backends.local import upload_to_local_folder
 from .backends.s3 import upload_to_s3
@@ -29,6 +30,27 @@ elif UPLOAD_STRATEGY == "MINIO":
     logger.info("MinIO upload strategy set.")
 
 
+def _no_strategy(file_object, file_name: str) -> str:
+    """Fallback used when no known upload strategy is configured."""
+    return "No upload strategy set, presentation cannot be created."
+
+
+def _select_upload_impl():
+    """Return the upload callable for UPLOAD_STRATEGY with its backend settings bound."""
+    strategies = {
+        StorageStrategy.LOCAL: upload_to_local_folder,
+        StorageStrategy.S3: partial(upload_to_s3, s3cfg=cfg.storage.s3, signed_url_expires_in=SIGNED_URL_EXPIRES_IN),
+        StorageStrategy.GCS: partial(upload_to_gcs, gcscfg=cfg.storage.gcs, signed_url_expires_in=SIGNED_URL_EXPIRES_IN),
+        StorageStrategy.AZURE: partial(upload_to_azure, azcfg=cfg.storage.azure, signed_url_expires_in=SIGNED_URL_EXPIRES_IN),
+        StorageStrategy.MINIO: partial(upload_to_minio, minicfg=cfg.storage.minio, signed_url_expires_in=SIGNED_URL_EXPIRES_IN),
+    }
+    return strategies.get(UPLOAD_STRATEGY, _no_strategy)
+
+
+# Resolved once since the strategy is fixed for the process
+_UPLOAD_IMPL = _select_upload_impl()
+
+
 def upload_file(file_object, suffix: str):
     """Upload a file to configured backend and return appropriate response.
 
@@ -36,18 +58,4 @@ def upload_file(file_object, suffix: str):
     :param suffix: File extension (e.g., 'pptx', 'docx', 'xlsx', 'eml')
     :return: Status message with download URL or save location
     """
-
-    object_name = generate_unique_object_name(suffix)
-
-    if UPLOAD_STRATEGY == "LOCAL":
-        return upload_to_local_folder(file_object, object_name)
-    elif UPLOAD_STRATEGY == "S3":
-        return upload_to_s3(file_object, object_name, cfg.storage.s3, SIGNED_URL_EXPIRES_IN)
-    elif UPLOAD_STRATEGY == "GCS":
-        return upload_to_gcs(file_object, object_name, cfg.storage.gcs, SIGNED_URL_EXPIRES_IN)
-    elif UPLOAD_STRATEGY == "AZURE":
-        return upload_to_azure(file_object, object_name, cfg.storage.azure, SIGNED_URL_EXPIRES_IN)
-    elif UPLOAD_STRATEGY == "MINIO":
-        return upload_to_minio(file_object, object_name, cfg.storage.minio, SIGNED_URL_EXPIRES_IN)
-    else:
-        return "No upload strategy set, presentation cannot be created."
+    return _UPLOAD_IMPL(file_object, generate_unique_object_name(suffix))
@@ -1,10 +1,36 @@
-import uuid
+import os
+import sys
+import secrets
+
+# MIME types keyed by file extension (without the dot)
+_CONTENT_TYPES = {
+    "pptx": sys.intern("application/vnd.openxmlformats-officedocument.presentationml.presentation"),
+    "docx": sys.intern("application/vnd.openxmlformats-officedocument.wordprocessingml.document"),
+    "xlsx": sys.intern("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "eml": sys.intern("application/octet-stream"),
+    "xml": sys.intern("application/xml"),
+}
 
 
 def generate_unique_object_name(suffix: str) -> str:
-    """Generate a unique object name using UUID and preserve the file extension."""
-    unique_id = str(uuid.uuid4())
-    return f"{unique_id}.{suffix}"
+    """Generate a unique object name from a random 128-bit token and preserve the file extension."""
+    return f"{secrets.token_urlsafe(16)}.{suffix}"
+
+
+def rewind(file_object) -> None:
+    """Seek the stream back to the start, skipping the seek when already there.
+
+    Non-seekable streams such as pipes are left as they are.
+    """
+    seekable = getattr(file_object, "seekable", None)
+    if seekable is not None and not seekable():
+        return
+    try:
+        if file_object.tell() == 0:
+            return
+    except (OSError, AttributeError):
+        pass
+    file_object.seek(0)
 
 
 def get_content_type(file_name: str) -> str:
@@ -14,14 +40,8 @@ def get_content_type(file_name: str) -> str:
     :return: MIME type string
     :raises ValueError: If file type is unknown
     """
-    if "pptx" in file_name:
-        return "application/vnd.openxmlformats-officedocument.presentationml.presentation"
-    elif "docx" in file_name:
-        return "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-    elif "xlsx" in file_name:
-        return "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-    elif "eml" in file_name:
-        return "application/octet-stream"
-    else:
+    content_type = _CONTENT_TYPES.get(os.path.splitext(file_name)[1][1:].lower())
+    if content_type is None:
         raise ValueError("Unknown file type")
+    return content_type
 
@@ -6,6 +6,23 @@ from openpyxl.utils import get_column_letter
 
 logger = logging.getLogger(__name__)
 
+# Formula references resolved by adjust_formula_references
+TABLE_REF_PATTERN = re.compile(r'T(\d+)\.([A-Z]+)\[([+-]?\d+)\]')  # T1.B[1]
+TABLE_RANGE_PATTERN = re.compile(
+    r'T(\d+)\.([A-Z]+)\[([+-]?\d+)\]:T(\d+)\.([A-Z]+)\[([+-]?\d+)\]'
+)  # T1.B[0]:T1.E[0]
+TABLE_FUNC_PATTERN = re.compile(
+    r'T(\d+)\.(SUM|AVERAGE|MAX|MIN)\(([A-Z]+)\[([+-]?\d+)\]:([A-Z]+)\[([+-]?\d+)\]\)'
+)  # T1.SUM(B[0]:E[0])
+REL_REF_PATTERN = re.compile(r'([A-Z]+)\[([+-]?\d+)\]')  # B[0]
+REL_RANGE_PATTERN = re.compile(r'([A-Z]+)\[([+-]?\d+)\]:([A-Z]+)\[([+-]?\d+)\]')  # B[0]:E[0]
+
+# Plain-text formulas recognized by detect_formula_pattern
+SUM_FORMULA_PATTERN = re.compile(r'^(SUM|sum)\([A-Z]+\d+:[A-Z]+\d+\)$')
+AVERAGE_FORMULA_PATTERN = re.compile(r'^(AVG|avg|AVERAGE|average)\([A-Z]+\d+:[A-Z]+\d+\)$')
+BINARY_OP_FORMULA_PATTERN = re.compile(r'^[A-Z]+\d+[+\-*/][A-Z]+\d+$')
+PERCENT_FORMULA_PATTERN = re.compile(r'^[A-Z]+\d+/[A-Z]+\d+\*100$')
+
 
 def parse_table(lines: List[str], start_idx: int) -> Tuple[Optional[List[List[str]]], int]:
     """Parse markdown table and return (table_data, next_index)."""
@@ -93,8 +110,6 @@ def adjust_formula_references(formula: str, current_excel_row: int, table_positi
         table_positions = {}
 
     # Table cell references e.g. T1.B[1]
-    table_pattern = r'T(\d+)\.([A-Z]+)\[([+-]?\d+)\]'
-
     def replace_table_reference(match):
         table_num = int(match.group(1))
         column = match.group(2)
@@ -107,14 +122,9 @@ def adjust_formula_references(formula: str, current_excel_row: int, table_positi
         actual_row = current_excel_row + offset
         return f"{column}{actual_row}"
 
-    adjusted = re.sub(table_pattern, replace_table_reference, formula)
+    adjusted = TABLE_REF_PATTERN.sub(replace_table_reference, formula)
 
     # Table range references e.g. T1.B[0]:T1.E[0]
-    table_range_pattern = r'T(\d+)\.([A-Z]+)\([+-]?\d+\):T(\d+)\.([A-Z]+)\([+-]?\d+\)'
-
-    # Corrected with brackets
-    table_range_pattern = r'T(\d+)\.([A-Z]+)\[([+-]?\d+)\]:T(\d+)\.([A-Z]+)\[([+-]?\d+)\]'
-
     def replace_table_range(match):
         start_table_num = int(match.group(1))
         start_col = match.group(2)
@@ -140,11 +150,9 @@ def adjust_formula_references(formula: str, current_excel_row: int, table_positi
 
         return f"{start_col}{start_row}:{end_col}{end_row}"
 
-    adjusted = re.sub(table_range_pattern, replace_table_range, adjusted)
+    adjusted = TABLE_RANGE_PATTERN.sub(replace_table_range, adjusted)
 
     # Simplified function over table range e.g. T1.SUM(B[0]:E[0])
-    table_func_pattern = r'T(\d+)\.(SUM|AVERAGE|MAX|MIN)\(([A-Z]+)\[([+-]?\d+)\]:([A-Z]+)\[([+-]?\d+)\]\)'
-
     def replace_table_function(match):
         table_num = int(match.group(1))
         func_name = match.group(2)
@@ -164,7 +172,7 @@ def adjust_formula_references(formula: str, current_excel_row: int, table_positi
 
         return f"={func_name}({start_col}{start_row}:{end_col}{end_row})"
 
-    adjusted = re.sub(table_func_pattern, replace_table_function, adjusted)
+    adjusted = TABLE_FUNC_PATTERN.sub(replace_table_function, adjusted)
 
     # Determine current table start for relative references
     current_table_start = None
@@ -173,8 +181,6 @@ def adjust_formula_references(formula: str, current_excel_row: int, table_positi
             current_table_start = table_start_row
 
     # Handle row-relative references e.g. B[0]
-    rel_pattern = r'([A-Z]+)\[([+-]?\d+)\]'
-
     def replace_rel(match):
         column = match.group(1)
         offset = int(match.group(2))
@@ -184,11 +190,9 @@ def adjust_formula_references(formula: str, current_excel_row: int, table_positi
             actual_row = current_excel_row + offset
         return f"{column}{actual_row}"
 
-    adjusted = re.sub(rel_pattern, replace_rel, adjusted)
+    adjusted = REL_REF_PATTERN.sub(replace_rel, adjusted)
 
     # Row-relative range e.g. B[0]:E[0]
-    range_pattern = r'([A-Z]+)\[([+-]?\d+)\]:([A-Z]+)\[([+-]?\d+)\]'
-
     def replace_range(match):
         start_col = match.group(1)
         start_offset = int(match.group(2))
@@ -202,7 +206,7 @@ def adjust_formula_references(formula: str, current_excel_row: int, table_positi
             end_row = current_excel_row + end_offset
         return f"{start_col}{start_row}:{end_col}{end_row}"
 
-    adjusted = re.sub(range_pattern, replace_range, adjusted)
+    adjusted = REL_RANGE_PATTERN.sub(replace_range, adjusted)
 
     return adjusted
 
@@ -212,13 +216,13 @@ def detect_formula_pattern(value: str) -> str:
     value = value.strip()
     if value.startswith('='):
         return value
-    if re.match(r'^(SUM|sum)\([A-Z]+\d+:[A-Z]+\d+\)$', value):
+    if SUM_FORMULA_PATTERN.match(value):
         return f"={value.upper()}"
-    if re.match(r'^(AVG|avg|AVERAGE|average)\([A-Z]+\d+:[A-Z]+\d+\)$', value):
+    if AVERAGE_FORMULA_PATTERN.match(value):
         return f"=AVERAGE({value.split('(')[1]}"
-    if re.match(r'^[A-Z]+\d+[+\-*/][A-Z]+\d+$', value):
+    if BINARY_OP_FORMULA_PATTERN.match(value):
         return f"={value}"
-    if re.match(r'^[A-Z]+\d+/[A-Z]+\d+\*100$', value):
+    if PERCENT_FORMULA_PATTERN.match(value):
         return f"={value}/100"
     return value
 
@@ -17,6 +17,9 @@ from upload_tools import upload_file
 
 logger = logging.getLogger(__name__)
 
+# encoding="..." attribute of an XML declaration
+XML_ENCODING_PATTERN = re.compile(r'encoding=["\']([^"\']+)["\']')
+
 
 class XMLValidationError(Exception):
     """Raised when XML content is invalid or incomplete."""
@@ -85,7 +88,7 @@ def create_xml_file(xml_content: str) -> str:
     # Extract encoding from XML declaration if present, default to UTF-8
     encoding = "utf-8"
     if xml_content.startswith('<?xml'):
-        match = re.search(r'encoding=["\']([^"\']+)["\']', xml_content)
+        match = XML_ENCODING_PATTERN.search(xml_content)
         if match:
             encoding = match.group(1)
             logger.debug(f"Using encoding from XML declaration: {encoding}")